@@ -1,16 +1,35 @@
-from dizqueTV.dizquetv import (API,
-                               convert_program_to_custom_show_item,
-                               convert_custom_show_to_programs,
-                               convert_plex_item_to_filler_item,
-                               convert_plex_item_to_program,
-                               convert_plex_server_to_dizque_plex_server,
-                               make_time_slot_from_dizque_program,
-                               repeat_list,
-                               repeat_and_shuffle_list,
-                               expand_custom_show_items,
-                               fill_in_watermark_settings
-                               )
-from dizqueTV.models import PlexServer
-from dizqueTV.plex_utils import PlexUtils
+import importlib
 
 from ._info import __version__
+
+# API and helpers are only imported on first use, so "import dizqueTV" stays cheap
+_LAZY_IMPORTS = {
+    "API": "dizqueTV.dizquetv",
+    "convert_program_to_custom_show_item": "dizqueTV.dizquetv",
+    "convert_custom_show_to_programs": "dizqueTV.dizquetv",
+    "convert_plex_item_to_filler_item": "dizqueTV.dizquetv",
+    "convert_plex_item_to_program": "dizqueTV.dizquetv",
+    "convert_plex_server_to_dizque_plex_server": "dizqueTV.dizquetv",
+    "make_time_slot_from_dizque_program": "dizqueTV.dizquetv",
+    "repeat_list": "dizqueTV.dizquetv",
+    "repeat_and_shuffle_list": "dizqueTV.dizquetv",
+    "expand_custom_show_items": "dizqueTV.dizquetv",
+    "fill_in_watermark_settings": "dizqueTV.dizquetv",
+    "PlexServer": "dizqueTV.models",
+    "PlexUtils": "dizqueTV.plex_utils",
+}
+
+__all__ = ["__version__", *_LAZY_IMPORTS]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if not module_name:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # only resolve once
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
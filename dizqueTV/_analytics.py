@@ -1,8 +1,20 @@
+import atexit
+import queue
+import threading
+import time
 import urllib
 import uuid
 
 import objectrest
 
+_session = objectrest.Session()
+_hits = queue.Queue(maxsize=500)
+_worker = None
+_worker_lock = threading.Lock()
+_BATCH_URL = "https://www.google-analytics.com/batch"
+_MAX_BATCH_SIZE = 20
+_FLUSH_TIMEOUT_SECONDS = 2
+
 
 def _time_uuid():
     return uuid.uuid1()
@@ -18,23 +30,69 @@ def _generate_uuid(random=False):
     return _time_uuid()
 
 
-def _verify_params(params_needed, **included_params):
-    for needed_param in params_needed:
-        if needed_param not in included_params.keys() or included_params.get(
-            needed_param
-        ):
-            return False
-    return True
-
-
 def _string_size(string: str, max_size: int, encoding: str = "utf-8"):
+    if encoding == "utf-8" and string.isascii():
+        # one byte per character, no need to encode
+        return len(string) <= max_size
     return len(string.encode(encoding)) <= max_size
 
 
-def _make_url(params_dict):
-    base_url = "https://www.google-analytics.com/collect"
-    args = urllib.parse.urlencode(params_dict)
-    return f"{base_url}?{args}"
+def _make_batch_body(hits):
+    return "\n".join(hits)
+
+
+def _post_hits(hits, session=_session, timeout=5):
+    try:
+        objectrest.post(
+            url=_BATCH_URL,
+            session=session,
+            data=_make_batch_body(hits=hits),
+            timeout=timeout,
+        )
+    except Exception:
+        pass  # analytics must never break the caller
+
+
+def _send_hits():
+    while True:
+        hits = [_hits.get()]
+        while len(hits) < _MAX_BATCH_SIZE:
+            try:
+                hits.append(_hits.get(timeout=1))
+            except queue.Empty:
+                break
+        _post_hits(hits=hits)
+
+
+def _flush_hits():
+    # the worker is a daemon thread and dies with the interpreter, so post whatever is still queued
+    # (a batch the worker is already sending when the interpreter exits may still be lost)
+    # all batches share one short deadline, so exiting without network access doesn't hang
+    deadline = time.monotonic() + _FLUSH_TIMEOUT_SECONDS
+    # the worker may still be mid-request on the shared session
+    session = objectrest.Session()
+    hits = []
+    while True:
+        try:
+            hits.append(_hits.get_nowait())
+        except queue.Empty:
+            break
+    for start in range(0, len(hits), _MAX_BATCH_SIZE):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        _post_hits(
+            hits=hits[start:start + _MAX_BATCH_SIZE], session=session, timeout=remaining
+        )
+
+
+def _start_worker():
+    global _worker
+    with _worker_lock:
+        if not _worker:
+            _worker = threading.Thread(target=_send_hits, daemon=True)
+            _worker.start()
+            atexit.register(_flush_hits)
 
 
 class GoogleAnalytics:
@@ -45,15 +103,22 @@ class GoogleAnalytics:
         self.version = "1"
         self.anonymize_ip = anonymous_ip
         self.do_not_track = do_not_track
+        # version and tracking ID are the same for every hit, only encode them once
+        self._base_query = urllib.parse.urlencode(
+            {"v": self.version, "tid": self.analytics_id}
+        )
 
     def _send(self, final_params):
         if self.do_not_track:
             return True
-        url = _make_url(params_dict=final_params)
-        print(url)
-        if objectrest.get(url=url):
-            return True
-        return False
+        _start_worker()
+        try:
+            _hits.put_nowait(
+                f"{self._base_query}&{urllib.parse.urlencode(final_params)}"
+            )
+        except queue.Full:
+            return False
+        return True
 
     def exception(
         self,
@@ -68,8 +133,6 @@ class GoogleAnalytics:
         if not user_id:
             user_id = str(_generate_uuid(random=random_uuid_if_needed))
         final_params = {
-            "v": self.version,
-            "tid": self.analytics_id,
             "t": "exception",
             "cid": user_id,
             "exf": 0,
@@ -99,8 +162,6 @@ class GoogleAnalytics:
         if not user_id:
             user_id = str(_generate_uuid(random=random_uuid_if_needed))
         final_params = {
-            "v": self.version,
-            "tid": self.analytics_id,
             "t": "event",
             "cid": user_id,
         }
@@ -127,8 +188,6 @@ class GoogleAnalytics:
         if not user_id:
             user_id = str(_generate_uuid(random=random_uuid_if_needed))
         final_params = {
-            "v": self.version,
-            "tid": self.analytics_id,
             "t": "pageview",
             "cid": user_id,
         }
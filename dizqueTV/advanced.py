@@ -1,7 +1,10 @@
+import re
 from typing import List
 
 import dizqueTV.dizquetv_requests as requests
 
+_FFMPEG_URL_PATTERN = re.compile(r"'([^']*)'")
+
 
 class Advanced:
     def __init__(self, dizque_instance):
@@ -16,7 +19,7 @@ class Advanced:
         :return: Raw text of list of FFMPEG URLs
         :rtype: str
         """
-        if channel_number not in self._dizque_instance.channel_numbers:
+        if not self._dizque_instance.channel_exists(channel_number=channel_number):
             raise Exception(f"Channel {channel_number} does not exist.")
         url = f"{self._dizque_instance.url}/playlist?channel={channel_number}"
         response = requests.get(url=url, log="info")
@@ -34,11 +37,9 @@ class Advanced:
         :rtype: str
         """
         urls = self.get_ffmpeg_urls_raw(channel_number=channel_number)
-        urls = urls.splitlines()
-        cleaned_urls = []
-        for url in urls[1:]:
-            cleaned_urls.append(url.split(" ")[1].replace("'", ""))
-        return cleaned_urls
+        # first line is a header, rest are "file '<url>'" lines
+        _, _, urls = urls.partition("\n")
+        return _FFMPEG_URL_PATTERN.findall(urls)
 
     def get_ffmpeg_url(self, channel_number: int) -> str:
         """
@@ -14,9 +14,10 @@ def check_for_dizque_instance(func: object):
     """
 
     @wraps(func)
-    def inner(obj, **kwargs):
-        if obj._dizque_instance:
-            return func(obj, **kwargs)
+    def inner(obj, *args, **kwargs):
+        # identity test only, this runs on every call to a decorated method
+        if obj._dizque_instance is not None:
+            return func(obj, *args, **kwargs)
         raise NotRemoteObjectError(object_type=type(obj).__name__)
 
     return inner
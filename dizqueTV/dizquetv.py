@@ -1,5 +1,6 @@
 import json
 import logging
+import time
 from datetime import datetime
 from typing import Dict, List, Union
 from xml.etree import ElementTree
@@ -31,6 +32,9 @@ from dizqueTV.models.templates import (CHANNEL_SETTINGS_DEFAULT,
                                        PLEX_SERVER_SETTINGS_TEMPLATE,
                                        WATERMARK_SETTINGS_DEFAULT)
 
+# how long to trust the list of channel numbers before asking dizqueTV again
+CHANNEL_NUMBERS_CACHE_SECONDS = 30
+
 
 def make_time_slot_from_dizque_program(
         program: Union[Program, Redirect], time: str, order: str
@@ -206,11 +210,7 @@ def repeat_list(items: List, how_many_times: int) -> List:
     :return: repeated list
     :rtype: list
     """
-    final_list = []
-    for _ in range(0, how_many_times):
-        for item in items:
-            final_list.append(item)
-    return final_list
+    return list(items) * how_many_times
 
 
 def repeat_and_shuffle_list(items: List, how_many_times: int) -> List:
@@ -229,10 +229,10 @@ def repeat_and_shuffle_list(items: List, how_many_times: int) -> List:
     """
     final_list = []
     for _ in range(0, how_many_times):
-        list_to_shuffle = items
+        # shuffle a copy, so the caller's list is left untouched
+        list_to_shuffle = list(items)
         helpers.shuffle(list_to_shuffle)
-        for item in list_to_shuffle:
-            final_list.append(item)
+        final_list.extend(list_to_shuffle)
     return final_list
 
 
@@ -318,6 +318,8 @@ class API:
         """
         self.url = url.rstrip("/")
         self.verbose = verbose
+        self._channel_numbers = None
+        self._channel_numbers_expiration = 0
         self.advanced = Advanced(dizque_instance=self)
         self.analytics = GoogleAnalytics(
             analytics_id=analytics_id,
@@ -401,7 +403,7 @@ class API:
             endpoint=endpoint, params=params, headers=headers, timeout=timeout
         )
         if response:
-            return response.json()
+            return requests.get_json(response=response)
         return {}
 
     @property
@@ -666,10 +668,34 @@ class API:
         :return: List of channel numbers
         :rtype: List[int]
         """
-        data = self._get_json(endpoint="/channelNumbers")
-        if data:
-            return data
-        return []
+        if (
+                self._channel_numbers is None
+                or time.monotonic() > self._channel_numbers_expiration
+        ):
+            self._channel_numbers = self._get_json(endpoint="/channelNumbers") or []
+            self._channel_numbers_expiration = (
+                    time.monotonic() + CHANNEL_NUMBERS_CACHE_SECONDS
+            )
+        return list(self._channel_numbers)
+
+    def channel_exists(self, channel_number: int) -> bool:
+        """
+        Check if a dizqueTV channel exists.
+
+        :param channel_number: Number of channel
+        :type channel_number: int
+        :return: True if the channel exists, False if not
+        :rtype: bool
+        """
+        return channel_number in self.channel_numbers
+
+    def _clear_channel_numbers_cache(self):
+        """
+        Force the next channel_numbers call to ask dizqueTV again.
+
+        :return: None
+        """
+        self._channel_numbers = None
 
     @property
     def channel_count(self) -> int:
@@ -689,6 +715,8 @@ class API:
         :return: Int number of the highest active channel
         :rtype: int
         """
+        # often used to pick a new channel number, so don't trust the cache
+        self._clear_channel_numbers_cache()
         numbers = self.channel_numbers
         if numbers:
             return max(numbers)
@@ -712,11 +740,14 @@ class API:
         :return: Int number of the lowest available channel
         :rtype: int
         """
+        # used to pick a new channel number, so don't trust the cache
+        self._clear_channel_numbers_cache()
+        numbers = self.channel_numbers
         possible = range(
-            1, self.highest_channel_number + 2
-        )  # between 1 and highest_channel_number + 1
+            1, max(numbers, default=0) + 2
+        )  # between 1 and highest channel number + 1
         # find the lowest number of the differences in the sets
-        return min(set(possible) - set(self.channel_numbers))
+        return min(set(possible) - set(numbers))
 
     def _fill_in_default_channel_settings(
             self, settings_dict: dict, handle_errors: bool = False
@@ -738,7 +769,10 @@ class API:
                 raise ChannelCreationError(
                     "You must include at least one program when creating a channel."
                 )
-        if settings_dict.get("number") in self.channel_numbers:
+        # another client may have added a channel since the numbers were cached
+        self._clear_channel_numbers_cache()
+        channel_numbers = self.channel_numbers
+        if settings_dict.get("number") in channel_numbers:
             if handle_errors:
                 settings_dict.pop(
                     "number"
@@ -748,7 +782,7 @@ class API:
                     f"Channel #{settings_dict.get('number')} already exists."
                 )
         if not settings_dict.get("number"):
-            settings_dict["number"] = max(self.channel_numbers) + 1
+            settings_dict["number"] = max(channel_numbers, default=0) + 1
         if not settings_dict.get("name"):
             settings_dict["name"] = f"Channel {settings_dict['number']}"
         if not settings_dict.get("startTime"):
@@ -816,6 +850,7 @@ class API:
                 template_settings_dict=CHANNEL_SETTINGS_TEMPLATE,
                 ignore_keys=["_id", "id"],
         ) and self._put(endpoint="/channel", data=kwargs):
+            self._clear_channel_numbers_cache()
             return self.get_channel(channel_number=kwargs["number"])
         return None
 
@@ -831,15 +866,38 @@ class API:
         """
         channel = self.get_channel(channel_number=channel_number)
         if channel:
-            if kwargs.get("iconPosition"):
-                kwargs["iconPosition"] = helpers.convert_icon_position(
-                    position_text=kwargs["iconPosition"]
-                )
-            new_settings = helpers._combine_settings_add_new(
-                new_settings_dict=kwargs, default_dict=channel._data
+            return self._update_channel_data(
+                channel_number=channel_number, current_data=channel._data, **kwargs
             )
-            if self._post(endpoint="/channel", data=new_settings):
-                return True
+        return False
+
+    def _update_channel_data(
+            self, channel_number: int, current_data: dict, **kwargs
+    ) -> bool:
+        """
+        Edit a dizqueTV channel, using already-known channel data as a base.
+
+        Saves downloading the channel again when the caller already has its full data.
+
+        :param channel_number: Number of channel to update
+        :type channel_number: int
+        :param current_data: Current JSON data for the channel
+        :type current_data: dict
+        :param kwargs: keyword arguments of setting names and values
+        :return: True if successful, False if unsuccessful
+        :rtype: bool
+        """
+        if kwargs.get("iconPosition"):
+            kwargs["iconPosition"] = helpers.convert_icon_position(
+                position_text=kwargs["iconPosition"]
+            )
+        new_settings = helpers._combine_settings_add_new(
+            new_settings_dict=kwargs, default_dict=current_data
+        )
+        if self._post(endpoint="/channel", data=new_settings):
+            if new_settings.get("number") != channel_number:
+                self._clear_channel_numbers_cache()
+            return True
         return False
 
     def delete_channel(self, channel_number: int) -> bool:
@@ -852,6 +910,7 @@ class API:
         :rtype: bool
         """
         if self._delete(endpoint="/channel", data={"number": channel_number}):
+            self._clear_channel_numbers_cache()
             return True
         return False
 
@@ -1486,7 +1545,7 @@ class API:
         :return: m3u8 object
         :rtype: m3u8.model.M3U8
         """
-        if channel_number not in self.channel_numbers:
+        if not self.channel_exists(channel_number=channel_number):
             raise Exception(f"Channel {channel_number} does not exist.")
         return m3u8.load(f"{self.url}/media-player/{channel_number}.m3u")
 
@@ -1501,7 +1560,7 @@ class API:
         :return: Stream URL for channel
         :rtype: str
         """
-        if channel_number not in self.channel_numbers:
+        if not self.channel_exists(channel_number=channel_number):
             raise Exception(f"Channel {channel_number} does not exist.")
         url = f"{self.url}/stream?channel={channel_number}"
         if audio_only:
@@ -1517,7 +1576,7 @@ class API:
         :return: Video URL for channel
         :rtype: str
         """
-        if channel_number not in self.channel_numbers:
+        if not self.channel_exists(channel_number=channel_number):
             raise Exception(f"Channel {channel_number} does not exist.")
         return f"{self.url}/video?channel={channel_number}"
 
@@ -1530,7 +1589,7 @@ class API:
         :return: Audio-only URL for channel
         :rtype: str
         """
-        if channel_number not in self.channel_numbers:
+        if not self.channel_exists(channel_number=channel_number):
             raise Exception(f"Channel {channel_number} does not exist.")
         return f"{self.url}/radio?channel={channel_number}"
 
@@ -1,10 +1,35 @@
 from typing import Union
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlparse
 
 import objectrest
 
 import dizqueTV.dizquetv_logging as logs
 
+try:
+    # orjson is optional, but much faster at parsing large channel documents
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+_sessions = {}
+
+
+def _get_session(url: str) -> objectrest.Session:
+    """
+    Get a reusable session for the host of a URL.
+
+    :param url: URL to get a session for
+    :type url: str
+    :return: objectrest.Session object
+    :rtype: objectrest.Session
+    """
+    host = urlparse(url).netloc
+    session = _sessions.get(host)
+    if not session:
+        session = objectrest.Session()
+        _sessions[host] = session
+    return session
+
 
 def get(
     url: str,
@@ -16,7 +41,9 @@ def get(
     if params:
         url += f"?{urlencode(params)}"
     try:
-        res = objectrest.get(url=url, headers=headers, timeout=timeout)
+        res = objectrest.get(
+            url=url, session=_get_session(url), headers=headers, timeout=timeout
+        )
         if log:
             logs.log(message=f"GET {url}", level=log)
             logs.log(message=f"Response: {res}", level=("error" if not res else log))
@@ -38,7 +65,12 @@ def post(
         url += f"?{urlencode(params)}"
     try:
         res = objectrest.post(
-            url=url, json=data, files=files, headers=headers, timeout=timeout
+            url=url,
+            session=_get_session(url),
+            json=data,
+            files=files,
+            headers=headers,
+            timeout=timeout,
         )
         if log:
             logs.log(message=f"POST {url}, Body: {data}", level=log)
@@ -60,7 +92,13 @@ def put(
     if params:
         url += f"?{urlencode(params)}"
     try:
-        res = objectrest.put(url=url, json=data, headers=headers, timeout=timeout)
+        res = objectrest.put(
+            url=url,
+            session=_get_session(url),
+            json=data,
+            headers=headers,
+            timeout=timeout,
+        )
         if log:
             logs.log(message=f"PUT {url}, Body: {data}", level=log)
             logs.log(message=f"Response: {res}", level=("error" if not res else log))
@@ -81,7 +119,13 @@ def delete(
     if params:
         url += f"?{urlencode(params)}"
     try:
-        res = objectrest.delete(url=url, json=data, headers=headers, timeout=timeout)
+        res = objectrest.delete(
+            url=url,
+            session=_get_session(url),
+            json=data,
+            headers=headers,
+            timeout=timeout,
+        )
         if log:
             logs.log(message=f"DELETE {url}, Body: {data}", level=log)
             logs.log(message=f"Response: {res}", level=("error" if not res else log))
@@ -89,3 +133,15 @@ def delete(
         # use json= rather than data= to convert single-quoted dict to double-quoted JSON
     except objectrest.exceptions.Timeout:
         return None
+
+
+def get_json(response: objectrest.Response) -> Union[dict, list, str]:
+    """
+    Parse the JSON body of a response.
+
+    :param response: Response to parse
+    :type response: objectrest.Response
+    :return: Parsed JSON data
+    :rtype: Union[dict, list, str]
+    """
+    return _json_loads(response.content)
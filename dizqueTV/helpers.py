@@ -1,9 +1,12 @@
 import collections
 import json
+import operator
 import os
 import random
+from bisect import bisect_right
 from concurrent.futures import ALL_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
+from itertools import accumulate
 from typing import List, Tuple, Union
 
 import numpy.random as numpy_random
@@ -12,12 +15,14 @@ from plexapi.server import PlexServer as PServer
 from plexapi.video import Episode, Movie, Video
 
 import dizqueTV.dizquetv_requests as requests
-from dizqueTV.exceptions import MissingSettingsError
+from dizqueTV.exceptions import GeneralException, MissingSettingsError
 from dizqueTV.models.media import FillerItem, Program, Redirect
 
 _access_tokens = {}
 _uris = {}
 
+_DIZQUE_DATETIME_TEMPLATE = "%Y-%m-%dT%H:%M:%S.000Z"
+
 
 # Internal Helpers
 def _multithread(
@@ -183,7 +188,7 @@ def _filter_dictionary(new_dictionary: dict, template_dict: dict) -> dict:
 
 
 def _settings_are_complete(
-        new_settings_dict: dict, template_settings_dict: json, ignore_keys: List = None
+        new_settings_dict: dict, template_settings_dict: dict, ignore_keys: List = None
 ) -> bool:
     """
     Check that all elements from the settings template are present in the new settings.
@@ -197,14 +202,13 @@ def _settings_are_complete(
     :return: True if valid, raise dizqueTV.exceptions.IncompleteSettingsError if not valid
     :rtype: bool
     """
-    if not ignore_keys:
-        ignore_keys = []
-    for k in template_settings_dict.keys():
-        if k not in new_settings_dict.keys():
-            # or not isinstance(new_settings_dict[k], type(template_settings_dict[k]))
-            if k in ignore_keys:
-                pass
-            else:
+    missing_keys = template_settings_dict.keys() - new_settings_dict.keys()
+    if ignore_keys:
+        missing_keys.difference_update(ignore_keys)
+    if missing_keys:
+        # report the first missing setting in template order
+        for k in template_settings_dict.keys():
+            if k in missing_keys:
                 raise MissingSettingsError(f"Missing setting: {k}")
     return True
 
@@ -267,10 +271,7 @@ def _object_has_attribute(obj: object, attribute_name: str) -> bool:
     :return: True if exists and is not None, False otherwise
     :rtype: bool
     """
-    if hasattr(obj, attribute_name):
-        if getattr(obj, attribute_name) is not None:
-            return True
-    return False
+    return getattr(obj, attribute_name, None) is not None
 
 
 def _make_program_dict_from_plex_item(
@@ -532,13 +533,9 @@ def make_show_dict(media_items: List) -> dict:
                 and item.type == "episode"
                 and item.episode
         ):
-            if item.showTitle in show_dict.keys():
-                if item.season in show_dict[item.showTitle].keys():
-                    show_dict[item.showTitle][item.season][item.episode] = item
-                else:
-                    show_dict[item.showTitle][item.season] = {item.episode: item}
-            else:
-                show_dict[item.showTitle] = {item.season: {item.episode: item}}
+            show_dict.setdefault(item.showTitle, {}).setdefault(item.season, {})[
+                item.episode
+            ] = item
     return show_dict
 
 
@@ -551,27 +548,16 @@ def order_show_dict(show_dict: dict) -> dict:
     :return: dict object with all episodes arranged in order by show-season-episode
     :rtype: dict
     """
-    episode_ordered_dict = {}
-    for show_name, seasons in show_dict.items():
-        episode_ordered_dict[show_name] = {}
-        for season_number, episodes in seasons.items():
-            ordered_episodes = {
-                episode_number: episode
-                for episode_number, episode in sorted(
-                    episodes.items(), key=lambda item: item[0]
-                )
-            }
-            episode_ordered_dict[show_name][season_number] = ordered_episodes
-    season_ordered_dict = {}
-    for show_name, seasons in episode_ordered_dict.items():
-        ordered_seasons = {
-            season_number: episodes
+    # sort seasons and episodes in the same pass, rather than building an intermediate dict
+    return {
+        show_name: {
+            season_number: dict(sorted(episodes.items(), key=lambda item: item[0]))
             for season_number, episodes in sorted(
                 seasons.items(), key=lambda item: item[0]
             )
         }
-        season_ordered_dict[show_name] = ordered_seasons
-    return season_ordered_dict
+        for show_name, seasons in show_dict.items()
+    }
 
 
 def add_durations_to_show_dict(show_dict: dict) -> dict:
@@ -675,7 +661,7 @@ def string_to_datetime(
 
 
 def datetime_to_string(
-        datetime_object: datetime, template: str = "%Y-%m-%dT%H:%M:%S.000Z"
+        datetime_object: datetime, template: str = _DIZQUE_DATETIME_TEMPLATE
 ) -> str:
     """
     Convert a datetime.datetime object to a string.
@@ -687,6 +673,12 @@ def datetime_to_string(
     :return: str representation of datetime
     :rtype: str
     """
+    if template == _DIZQUE_DATETIME_TEMPLATE:
+        # dizqueTV's own format, built directly rather than parsing the template each time
+        return (
+            f"{datetime_object.year:04d}-{datetime_object.month:02d}-{datetime_object.day:02d}"
+            f"T{datetime_object.hour:02d}:{datetime_object.minute:02d}:{datetime_object.second:02d}.000Z"
+        )
     return datetime_object.strftime(template)
 
 
@@ -735,6 +727,18 @@ def duration_to_string(milliseconds: int) -> str:
     return "%02d:%02d:%02d.%01d" % (hours, minutes, seconds, milliseconds)
 
 
+def _utc_offset() -> timedelta:
+    """
+    Get the offset of local time from UTC time.
+
+    Read from a single clock reading, rather than subtracting two separate now() calls.
+
+    :return: datetime.timedelta of local time minus UTC time
+    :rtype: datetime.timedelta
+    """
+    return datetime.now().astimezone().utcoffset()
+
+
 def adjust_datetime_for_timezone(local_time: datetime) -> datetime:
     """
     Shift datetime.datetime in regards to UTC time.
@@ -744,8 +748,7 @@ def adjust_datetime_for_timezone(local_time: datetime) -> datetime:
     :return: Shifted datetime.datetime object
     :rtype: datetime.datetime
     """
-    difference = datetime.now() - datetime.utcnow()
-    return local_time - difference
+    return local_time - _utc_offset()
 
 
 def hours_difference_in_timezone() -> int:
@@ -755,7 +758,7 @@ def hours_difference_in_timezone() -> int:
     :return: int number of hours
     :rtype: int
     """
-    return int((datetime.utcnow() - datetime.now()).total_seconds() / 60 / 60)
+    return int(-_utc_offset().total_seconds() / 60 / 60)
 
 
 def shift_time(
@@ -805,7 +808,7 @@ def get_nearest_30_minute_mark() -> str:
         now = now.replace(second=0, microsecond=0, minute=30)
     else:
         now = now.replace(second=0, microsecond=0, minute=0)
-    return now.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    return datetime_to_string(datetime_object=now)
 
 
 def convert_24_time_to_milliseconds_past_midnight(time_string: str) -> int:
@@ -840,12 +843,8 @@ def get_milliseconds_between_two_hours(start_hour: int, end_hour: int) -> int:
     :return: int of milliseconds between the two hours
     :rtype: int
     """
-    start_date = datetime(2020, 1, 1, start_hour, 0)
-    if end_hour < start_hour:
-        end_date = datetime(2020, 1, 2, end_hour, 0)
-    else:
-        end_date = datetime(2020, 1, 1, end_hour, 0)
-    return int((end_date - start_date).total_seconds()) * 1000
+    # wraps past midnight if the end hour is earlier than the start hour
+    return ((end_hour - start_hour) % 24) * 60 * 60 * 1000
 
 
 def get_milliseconds_between_two_datetimes(
@@ -877,13 +876,46 @@ def get_needed_flex_time(
     :return: int of milliseconds needed to stretch item
     :rtype: int
     """
-    minute_start = 30 if datetime.utcnow().minute >= 30 else 0
+    return _get_needed_flex_time_in_frame(
+        item_time_milliseconds=item_time_milliseconds,
+        allowed_milliseconds_time_frame=_get_flex_time_frame(
+            allowed_minutes_time_frame=allowed_minutes_time_frame
+        ),
+    )
+
+
+def _get_flex_time_frame(allowed_minutes_time_frame: int) -> int:
+    """
+    Get the interval length, in milliseconds, that items are stretched to for the current half hour.
+
+    Only depends on the current time, so can be worked out once for a whole list of items.
 
-    allowed_milliseconds_time_frame = (
+    :param allowed_minutes_time_frame: how long an interval the item is supposed to be, in minutes
+    :type allowed_minutes_time_frame: int
+    :return: int of milliseconds in the interval
+    :rtype: int
+    """
+    minute_start = 30 if datetime.utcnow().minute >= 30 else 0
+    return (
             (allowed_minutes_time_frame + (minute_start % allowed_minutes_time_frame))
             * 60
             * 1000
     )
+
+
+def _get_needed_flex_time_in_frame(
+        item_time_milliseconds: int, allowed_milliseconds_time_frame: int
+) -> int:
+    """
+    Get how many milliseconds needed to stretch an item's runtime to a multiple of an interval length.
+
+    :param item_time_milliseconds: how long the item is in milliseconds
+    :type item_time_milliseconds: int
+    :param allowed_milliseconds_time_frame: interval length, in milliseconds (see _get_flex_time_frame)
+    :type allowed_milliseconds_time_frame: int
+    :return: int of milliseconds needed to stretch item
+    :rtype: int
+    """
     remainder = allowed_milliseconds_time_frame - (
             item_time_milliseconds % allowed_milliseconds_time_frame
     )
@@ -1083,7 +1115,8 @@ def remove_duplicates(items: List) -> List:
     :return: list of filtered items
     :rtpye: list[object]
     """
-    return list(set(items))
+    # dict keys keep insertion order, so the first occurrence of each item stays in place
+    return list(dict.fromkeys(items))
 
 
 def remove_duplicates_by_attribute(items: List, attribute_name: str) -> List:
@@ -1098,14 +1131,14 @@ def remove_duplicates_by_attribute(items: List, attribute_name: str) -> List:
     :rtype: list[object]
     """
     filtered = []
-    filtered_attr = []
+    filtered_attr = set()
     for item in items:
         attr = getattr(item, attribute_name)
         if not attr:
             filtered.append(item)
         elif attr not in filtered_attr:
             filtered.append(item)
-            filtered_attr.append(attr)
+            filtered_attr.add(attr)
     return filtered
 
 
@@ -1134,6 +1167,133 @@ def sort_media_alphabetically(
     return sorted_items
 
 
+def _remove_duplicates_by_key(items: List[dict], key: str) -> List[dict]:
+    """
+    Remove duplicate raw JSON items from a list, comparing on a specific key.
+
+    Same as remove_duplicates_by_attribute, for dictionaries.
+
+    :param items: list of JSON data to parse
+    :type items: List[dict]
+    :param key: name of key to check by
+    :type key: str
+    :return: list of filtered JSON data
+    :rtype: List[dict]
+    """
+    filtered = []
+    seen = set()
+    for item in items:
+        value = item.get(key)
+        if not value:
+            filtered.append(item)
+        elif value not in seen:
+            filtered.append(item)
+            seen.add(value)
+    return filtered
+
+
+def _sort_program_data_alphabetically(programs_data: List[dict]) -> List[dict]:
+    """
+    Sort raw program data alphabetically, the same way as sort_media_alphabetically.
+
+    :param programs_data: List of program JSON data
+    :type programs_data: List[dict]
+    :return: List of program JSON data
+    :rtype: List[dict]
+    """
+    with_titles = []
+    without_titles = []
+    for program in programs_data:
+        if program.get("title") is not None:
+            with_titles.append(program)
+        else:
+            without_titles.append(program)
+    with_titles.sort(
+        key=lambda x: (x.get("showTitle") if x.get("type") == "episode" else x["title"])
+    )
+    with_titles.extend(without_titles)
+    return with_titles
+
+
+def _sort_program_data_by_release_date(programs_data: List[dict]) -> List[dict]:
+    """
+    Sort raw program data by release date, the same way as sort_media_by_release_date.
+
+    :param programs_data: List of program JSON data
+    :type programs_data: List[dict]
+    :return: List of program JSON data
+    :rtype: List[dict]
+    """
+    with_dates = []
+    without_dates = []
+    for program in programs_data:
+        if program.get("date") is not None:
+            with_dates.append(program)
+        else:
+            without_dates.append(program)
+    # YYYY-MM-DD strings sort in the same order as the dates they represent
+    with_dates.sort(key=operator.itemgetter("date"))
+    with_dates.extend(_sort_program_data_alphabetically(programs_data=without_dates))
+    return with_dates
+
+
+def _sort_program_data_by_duration(programs_data: List[dict]) -> List[dict]:
+    """
+    Sort raw program data by duration, the same way as sort_media_by_duration.
+
+    Note: Automatically removes redirect items.
+
+    :param programs_data: List of program JSON data
+    :type programs_data: List[dict]
+    :return: List of program JSON data
+    :rtype: List[dict]
+    """
+    return sorted(
+        (
+            program
+            for program in programs_data
+            if program.get("type") not in (None, "redirect")
+            and program.get("duration") is not None
+        ),
+        key=operator.itemgetter("duration"),
+    )
+
+
+def _shuffle_program_data(programs_data: List[dict]) -> List[dict]:
+    """
+    Shuffle a copy of raw program data, the same way as sort_media_randomly.
+
+    :param programs_data: List of program JSON data
+    :type programs_data: List[dict]
+    :return: List of program JSON data
+    :rtype: List[dict]
+    """
+    programs_data = list(programs_data)
+    shuffle(items=programs_data)
+    return programs_data
+
+
+def _remove_duplicate_program_data(programs_data: List[dict]) -> List[dict]:
+    """
+    Remove duplicate raw program data by ratingKey, the same way as remove_duplicate_media_items.
+
+    Note: Automatically removes redirect items.
+
+    :param programs_data: List of program JSON data
+    :type programs_data: List[dict]
+    :return: List of program JSON data
+    :rtype: List[dict]
+    """
+    return _remove_duplicates_by_key(
+        items=[
+            program
+            for program in programs_data
+            if program.get("type") not in (None, "redirect")
+        ],
+        key="ratingKey",
+    )
+
+
 def sort_media_by_release_date(
         media_items: List[Union[Program, FillerItem]]
 ) -> List[Union[Program, FillerItem]]:
@@ -1150,9 +1310,8 @@ def sort_media_by_release_date(
     items_with_dates, items_without_dates = _separate_with_and_without(
         items=media_items, attribute_name="date"
     )
-    sorted_items = sorted(
-        items_with_dates, key=lambda x: datetime.strptime(x.date, "%Y-%m-%d")
-    )
+    # YYYY-MM-DD strings sort in the same order as the dates they represent
+    sorted_items = sorted(items_with_dates, key=operator.attrgetter("date"))
     sorted_items.extend(sort_media_alphabetically(media_items=items_without_dates))
     return sorted_items
 
@@ -1168,19 +1327,14 @@ def _sort_shows_by_season_order(shows_dict: dict) -> List[Union[Program, FillerI
     :return: List of Program and FillerItem objects
     :rtype: List[Union[Program, FillerList]]
     """
-    sorted_list = []
-    sorted_shows = sorted(shows_dict.items(), key=lambda show_name: show_name)
-    for show in sorted_shows:
-        sorted_seasons = sorted(
-            show[1].items(), key=lambda season_number: season_number
-        )
-        for season in sorted_seasons:
-            sorted_episodes = sorted(
-                season[1].items(), key=lambda episode_number: episode_number
-            )
-            for item in sorted_episodes:
-                sorted_list.append(item[1])
-    return sorted_list
+    flat_episodes = [
+        (show_name, season_number, episode_number, item)
+        for show_name, seasons in shows_dict.items()
+        for season_number, episodes in seasons.items()
+        for episode_number, item in episodes.items()
+    ]
+    flat_episodes.sort(key=operator.itemgetter(0, 1, 2))
+    return [episode[3] for episode in flat_episodes]
 
 
 def sort_media_by_season_order(
@@ -1197,9 +1351,12 @@ def sort_media_by_season_order(
     :rtype: List[Union[Program, FillerList]]
     """
     non_shows = get_non_shows(media_items=media_items)
+    sorted_movies = sort_media_alphabetically(media_items=non_shows)
+    if not any(getattr(item, "type", None) == "episode" for item in media_items):
+        # nothing to arrange by series-season-episode
+        return sorted_movies
     show_dict = make_show_dict(media_items=media_items)
     sorted_shows = _sort_shows_by_season_order(shows_dict=show_dict)
-    sorted_movies = sort_media_alphabetically(media_items=non_shows)
     sorted_all = sorted_shows + sorted_movies
     return sorted_all
 
@@ -1220,13 +1377,10 @@ def sort_media_by_duration(
     non_redirects = [
         item
         for item in media_items
-        if (
-                _object_has_attribute(obj=item, attribute_name="duration")
-                and _object_has_attribute(obj=item, attribute_name="type")
-                and item.type != "redirect"
-        )
+        if getattr(item, "type", None) not in (None, "redirect")
+        and getattr(item, "duration", None) is not None
     ]
-    sorted_media = sorted(non_redirects, key=lambda x: x.duration)
+    sorted_media = sorted(non_redirects, key=operator.attrgetter("duration"))
     return sorted_media
 
 
@@ -1380,31 +1534,25 @@ def balance_shows(
     ordered_show_dict_with_durations = add_durations_to_show_dict(
         show_dict=ordered_show_dict
     )
-    show_durations = []
-    for show_name in ordered_show_dict_with_durations.keys():
-        show_durations.append(ordered_show_dict_with_durations[show_name]["duration"])
-    shortest_show_length = min(show_durations)
-    margin = 1 + margin_of_correction
+    shortest_show_length = min(
+        (show_data["duration"] for show_data in ordered_show_dict_with_durations.values()),
+        default=0,
+    )
+    # compare against a precomputed cap, rather than dividing by the shortest length per episode
+    max_show_duration = shortest_show_length * (1 + margin_of_correction)
     final_shows = []
-    for show_name, show_data in ordered_show_dict_with_durations.items():
+    for show_data in ordered_show_dict_with_durations.values():
         show_running_duration = 0
-        continue_with_show = True
-        for season_number, season_data in show_data["seasons"].items():
-            if not continue_with_show:
+        show_episodes = (
+            episode_data
+            for season_data in show_data["seasons"].values()
+            for episode_data in season_data["episodes"].values()
+        )
+        for episode_data in show_episodes:
+            show_running_duration += episode_data["duration"]
+            if show_running_duration > max_show_duration:
                 break
-            for episode_number, episode_data in season_data["episodes"].items():
-                if not continue_with_show:
-                    break
-                potential_show_duration = (
-                        show_running_duration + episode_data["duration"]
-                )
-                if (
-                        float(potential_show_duration) / float(shortest_show_length)
-                ) <= margin:
-                    final_shows.append(episode_data["episode"])
-                    show_running_duration += episode_data["duration"]
-                else:
-                    continue_with_show = False
+            final_shows.append(episode_data["episode"])
     sorted_movies = sort_media_alphabetically(media_items=non_shows)
     sorted_all = final_shows + sorted_movies
     return sorted_all
@@ -1424,10 +1572,7 @@ def remove_non_programs(
     return [
         item
         for item in media_items
-        if (
-                _object_has_attribute(obj=item, attribute_name="type")
-                and item.type != "redirect"
-        )
+        if getattr(item, "type", None) not in (None, "redirect")
     ]
 
 
@@ -1477,34 +1622,82 @@ def _get_first_x_minutes_of_programs(
     return programs_to_return, running_total
 
 
-def _get_first_x_minutes_of_programs_return_unused(
-        programs: List[Union[Program, Redirect, FillerItem]], minutes: int
-) -> Tuple[
-    List[Union[Program, Redirect, FillerItem]],
-    int,
-    List[Union[Program, Redirect, FillerItem]],
-]:
+def _split_programs_into_blocks(
+        programs: List[Union[Program, Redirect, FillerItem]],
+        minutes: int,
+        first_block_minutes: int = None,
+) -> List[Tuple[List[Union[Program, Redirect, FillerItem]], int]]:
     """
-    Keep building a list of programs in order until a duration limit is met.
+    Split a list of programs, in order, into consecutive blocks that each fit within a duration limit.
 
-    :param programs: list of Program objects to pull from
+    Equivalent to repeatedly calling _get_first_x_minutes_of_programs on the leftovers,
+    but the running times are only summed once.
+
+    :param programs: list of Program objects to split
     :type programs: List[Union[Program, Redirect, FillerList]]
-    :param minutes: threshold, in minutes
+    :param minutes: threshold for each block, in minutes
     :type minutes: int
-    :return: list of Program objects, total running time in milliseconds, unused Programs
-    :rtype: Tuple[List[Union[Program, Redirect, FillerList]], int, List[Union[Program, Redirect, FillerList]]]
+    :param first_block_minutes: threshold for the first block only, in minutes (default: same as minutes). Unlike the other blocks, the first block may be empty.
+    :type first_block_minutes: int, optional
+    :return: list of (Program objects in block, total running time of block in milliseconds)
+    :rtype: List[Tuple[List[Union[Program, Redirect, FillerList]], int]]
     """
     milliseconds = minutes * 60 * 1000
-    running_total = 0
-    leftover_programs = []
-    programs_to_return = []
-    for program in programs:
-        if (running_total + program.duration) <= milliseconds:
-            running_total += program.duration
-            programs_to_return.append(program)
-        else:
-            break
-    for program in programs:
-        if program not in programs_to_return:
-            leftover_programs.append(program)
-    return programs_to_return, running_total, leftover_programs
+    running_totals = list(accumulate(program.duration for program in programs))
+    blocks = []
+    start = 0
+    block_start_total = 0
+    if first_block_minutes is not None:
+        start = bisect_right(running_totals, first_block_minutes * 60 * 1000)
+        block_start_total = running_totals[start - 1] if start else 0
+        blocks.append((programs[:start], block_start_total))
+    while start < len(programs):
+        end = bisect_right(running_totals, block_start_total + milliseconds, lo=start)
+        if end == start:
+            raise GeneralException(
+                f"A program is longer than {minutes} minutes and cannot fit in a block."
+            )
+        block_end_total = running_totals[end - 1]
+        blocks.append((programs[start:end], block_end_total - block_start_total))
+        start = end
+        block_start_total = block_end_total
+    return blocks
+
+
+def _make_night_channel_lineup(
+        blocks: List[Tuple[List[Union[Program, Redirect, FillerItem, dict]], int]],
+        block_length: int,
+        night_channel_number: int,
+        night_block_length: int,
+) -> List[Union[Program, Redirect, FillerItem, dict]]:
+    """
+    Interleave blocks of programs with redirects to a night channel, in a single pass.
+
+    Each block is padded with offline time up to block_length, then followed by the redirect.
+
+    :param blocks: list of (Program objects in block, total running time of block in milliseconds)
+    :type blocks: List[Tuple[List[Union[Program, Redirect, FillerList, dict]], int]]
+    :param block_length: length of each block of programs, in milliseconds
+    :type block_length: int
+    :param night_channel_number: number of the channel to redirect to
+    :type night_channel_number: int
+    :param night_block_length: length of each redirect, in milliseconds
+    :type night_block_length: int
+    :return: list of Program objects and raw offline/redirect program data
+    :rtype: List[Union[Program, Redirect, FillerList, dict]]
+    """
+    redirect_data = {
+        "duration": night_block_length,
+        "isOffline": True,
+        "channel": night_channel_number,
+        "type": "redirect",
+    }
+    lineup = []
+    for programs, running_time in blocks:
+        lineup.extend(programs)
+        if running_time < block_length:
+            # add flex time between last item and night channel
+            lineup.append({"duration": block_length - running_time, "isOffline": True})
+        # each redirect gets its own copy, so editing one later doesn't edit them all
+        lineup.append(redirect_data.copy())
+    return lineup
@@ -1,3 +1,5 @@
+import copy
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import List, Union
 
@@ -26,6 +28,13 @@ from dizqueTV.models.templates import (CHANNEL_FFMPEG_SETTINGS_DEFAULT,
                                        TIME_SLOT_SETTINGS_TEMPLATE,
                                        TRACK_PROGRAM_TEMPLATE)
 
+_PROGRAM_TEMPLATES = {
+    "movie": MOVIE_PROGRAM_TEMPLATE,
+    "episode": EPISODE_PROGRAM_TEMPLATE,
+    "track": TRACK_PROGRAM_TEMPLATE,
+    "redirect": REDIRECT_PROGRAM_TEMPLATE,
+}
+
 
 class ChannelFFMPEGSettings(BaseAPIObject):
     def __init__(self, data: dict, dizque_instance, channel_instance):
@@ -335,10 +344,19 @@ class Schedule(BaseAPIObject):
 
 
 class Channel(BaseAPIObject):
+    # set while inside batch_edit(), updates are held back until the block exits
+    _deferred = False
+    _dirty = False
+
     def __init__(self, data: dict, dizque_instance, plex_server: PServer = None):
         super().__init__(data, dizque_instance)
         self._program_data = data.get("programs", [])
         self._fillerCollections_data = data.get("fillerCollections")
+        self._programs_cache = None
+        self._program_by_title = None
+        self._redirect_by_channel = None
+        self._program_index = None
+        self._filler_lists_cache = None
         self.fillerRepeatCooldown = data.get("fillerRepeatCooldown")
         self.startTime = data.get("startTime")
         self.offlinePicture = data.get("offlinePicture")
@@ -349,14 +367,7 @@ class Channel(BaseAPIObject):
         self.duration = data.get("duration")
         self.stealth = data.get("stealth")
         self._id = data.get("_id")
-        self.fallback = [
-            FillerItem(
-                data=filler_data,
-                dizque_instance=dizque_instance,
-                filler_list_instance=None,
-            )
-            for filler_data in data.get("fallback")
-        ]
+        self._fallback_cache = None
         self.watermark = (
             Watermark(
                 data=data.get("watermark"),
@@ -392,15 +403,47 @@ class Channel(BaseAPIObject):
                 channel_instance=self,
             )
         self.plex_server = plex_server
-        self.scheduledableItems = self._get_schedulable_items()
+        self._schedulable_items_cache = None
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.number}:{self.name})"
 
+    @property
+    def fallback(self) -> List[FillerItem]:
+        """
+        Get all fallback filler items on this channel.
+
+        :return: List of FillerItem objects
+        :rtype: List[FillerItem]
+        """
+        if self._fallback_cache is None:
+            dizque_instance = self._dizque_instance
+            self._fallback_cache = [
+                FillerItem(
+                    data=filler_data,
+                    dizque_instance=dizque_instance,
+                    filler_list_instance=None,
+                )
+                for filler_data in self._data.get("fallback") or []
+            ]
+        return self._fallback_cache
+
     @property
     def startTime_datetime(self) -> datetime:
         return helpers.string_to_datetime(date_string=self.startTime)
 
+    @property
+    def scheduledableItems(self) -> List[TimeSlotItem]:
+        """
+        Get all programs able to be scheduled for this channel.
+
+        :return: List of TimeSlotItem objects
+        :rtype: List[TimeSlotItem]
+        """
+        if self._schedulable_items_cache is None:
+            self._schedulable_items_cache = self._get_schedulable_items()
+        return self._schedulable_items_cache
+
     def _get_schedulable_items(self) -> List[TimeSlotItem]:
         """
         Get all programs able to be scheduled for this channel.
@@ -408,7 +451,7 @@ class Channel(BaseAPIObject):
         :return: List of TimeSlotItem objects
         :rtype: List[TimeSlotItem]
         """
-        used_titles = []
+        used_titles = set()
         schedulable_items = []
         for program in self.programs:
             if (
@@ -419,7 +462,7 @@ class Channel(BaseAPIObject):
                 schedulable_items.append(
                     TimeSlotItem(item_type="redirect", item_value=program.channel)
                 )
-                used_titles.append(program.channel)
+                used_titles.add(program.channel)
             elif program.showTitle and program.showTitle not in used_titles:
                 if program.type == "movie":
                     schedulable_items.append(
@@ -429,7 +472,7 @@ class Channel(BaseAPIObject):
                     schedulable_items.append(
                         TimeSlotItem(item_type="tv", item_value=program.showTitle)
                     )
-                used_titles.append(program.showTitle)
+                used_titles.add(program.showTitle)
         return schedulable_items
 
     # CRUD Operations
@@ -443,12 +486,88 @@ class Channel(BaseAPIObject):
         :return: List of Program and CustomShow objects
         :rtype: List[Union[Program, CustomShow]]
         """
-        return self._dizque_instance.parse_custom_shows_and_non_custom_shows(
-            items=self._program_data,
-            non_custom_show_type=Program,
-            dizque_instance=self._dizque_instance,
-            channel_instance=self,
-        )
+        if self._programs_cache is None:
+            self._programs_cache = self._dizque_instance.parse_custom_shows_and_non_custom_shows(
+                items=self._program_data,
+                non_custom_show_type=Program,
+                dizque_instance=self._dizque_instance,
+                channel_instance=self,
+            )
+        return list(self._programs_cache)
+
+    def _clear_cache(self):
+        """
+        Drop the cached Program and FillerList objects for this channel.
+
+        :return: None
+        """
+        self._programs_cache = None
+        self._program_by_title = None
+        self._redirect_by_channel = None
+        self._program_index = None
+        self._filler_lists_cache = None
+        self._schedulable_items_cache = None
+
+    def _get_program_index(self, program: Program) -> Union[int, None]:
+        """
+        Get the position of a program in this channel's program data.
+
+        :param program: Program object to find
+        :type program: Program
+        :return: Index of the matching program data or None
+        :rtype: int
+        """
+        if program.type == "redirect":
+            for index, a_program in enumerate(self._program_data):
+                if a_program["type"] == "redirect":
+                    return index
+            return None
+        if self._program_index is None:
+            self._program_index = {}
+            for index, a_program in enumerate(self._program_data):
+                self._program_index.setdefault(a_program.get("title"), index)
+        return self._program_index.get(program.title)
+
+    def _get_programs_by_title(self) -> dict:
+        """
+        Get the program data on this channel, keyed by program title.
+
+        Custom show items are not included.
+
+        :return: Dictionary of program titles and program data
+        :rtype: dict
+        """
+        if self._program_by_title is None:
+            self._program_by_title = {}
+            for a_program in self._program_data:
+                if not a_program.get("customShowId"):
+                    self._program_by_title.setdefault(a_program.get("title"), a_program)
+        return self._program_by_title
+
+    def _get_redirects_by_channel(self) -> dict:
+        """
+        Get the redirect data on this channel, keyed by the channel number they redirect to.
+
+        :return: Dictionary of channel numbers and redirect data
+        :rtype: dict
+        """
+        if self._redirect_by_channel is None:
+            self._redirect_by_channel = {}
+            for a_program in self._program_data:
+                if a_program.get("channel") is not None:
+                    self._redirect_by_channel.setdefault(a_program["channel"], a_program)
+        return self._redirect_by_channel
+
+    def program_exists(self, program_title: str) -> bool:
+        """
+        Check if a program is on this channel.
+
+        :param program_title: Title of program
+        :type program_title: str
+        :return: True if a program with this title is on the channel, False if not
+        :rtype: bool
+        """
+        return program_title in self._get_programs_by_title()
 
     @decorators.check_for_dizque_instance
     def get_program(
@@ -468,11 +587,18 @@ class Channel(BaseAPIObject):
             raise MissingParametersError(
                 "Please include either a program_title or a redirect_channel_number."
             )
-        for program in self.programs:
-            if (program_title and program.title == program_title) or (
-                    redirect_channel_number and redirect_channel_number == program.channel
-            ):
-                return program
+        program_data = None
+        if program_title:
+            program_data = self._get_programs_by_title().get(program_title)
+        if not program_data and redirect_channel_number:
+            program_data = self._get_redirects_by_channel().get(redirect_channel_number)
+        if program_data:
+            # only wrap the match, rather than every program on the channel
+            return Program(
+                data=program_data,
+                dizque_instance=self._dizque_instance,
+                channel_instance=self,
+            )
         return None
 
     @property
@@ -483,10 +609,27 @@ class Channel(BaseAPIObject):
         :return: List of FillerList objects
         :rtype: List[FillerList]
         """
-        return [
-            FillerList(data=filler_list, dizque_instance=self._dizque_instance)
-            for filler_list in self._fillerCollections_data
-        ]
+        if self._filler_lists_cache is None:
+            dizque_instance = self._dizque_instance
+            self._filler_lists_cache = [
+                FillerList(data=filler_list, dizque_instance=dizque_instance)
+                for filler_list in self._fillerCollections_data
+            ]
+        return list(self._filler_lists_cache)
+
+    def filler_list_exists(self, filler_list_id: str) -> bool:
+        """
+        Check if a filler list is used on this channel.
+
+        :param filler_list_id: ID of filler list
+        :type filler_list_id: str
+        :return: True if the filler list is on the channel, False if not
+        :rtype: bool
+        """
+        return any(
+            filler_list_id == a_list.get("id")
+            for a_list in self._fillerCollections_data or []
+        )
 
     @decorators.check_for_dizque_instance
     def get_filler_list(self, filler_list_title: str) -> Union[FillerList, None]:
@@ -498,9 +641,11 @@ class Channel(BaseAPIObject):
         :return: FillerList object or None
         :rtype: FillerList
         """
-        for filler_list in self.filler_lists:
-            if filler_list.name == filler_list_title:
-                return filler_list
+        for filler_list in self._fillerCollections_data or []:
+            if filler_list.get("name") == filler_list_title:
+                return FillerList(
+                    data=filler_list, dizque_instance=self._dizque_instance
+                )
         return None
 
     # Update
@@ -519,22 +664,88 @@ class Channel(BaseAPIObject):
             self.__init__(data=json_data, dizque_instance=self._dizque_instance)
             del temp_channel
 
+    def _reload_locally(self, **kwargs):
+        """
+        Apply new settings to the local channel data and reload current Channel object from it.
+
+        :param kwargs: keyword arguments of Channel settings names and values
+        :return: None
+        """
+        # match what dizqueTV would send back if the channel were downloaded again
+        if kwargs.get("iconPosition"):
+            kwargs["iconPosition"] = helpers.convert_icon_position(
+                position_text=kwargs["iconPosition"]
+            )
+        # don't hold on to dicts the caller (or another program in the list) may still share
+        for key in ("programs", "fallback"):
+            if kwargs.get(key) is not None:
+                kwargs[key] = copy.deepcopy(kwargs[key])
+        self._data.update(kwargs)
+        self.__init__(
+            data=self._data,
+            dizque_instance=self._dizque_instance,
+            plex_server=self.plex_server,
+        )
+
     @decorators.check_for_dizque_instance
-    def update(self, **kwargs) -> bool:
+    def update(self, _refresh: bool = False, **kwargs) -> bool:
         """
         Edit this Channel on dizqueTV.
 
-        Automatically refreshes current Channel object.
+        Automatically reloads current Channel object from the new settings.
 
+        :param _refresh: Re-download the channel from dizqueTV after updating, rather than reloading locally (default: False)
+        :type _refresh: bool, optional
         :param kwargs: keyword arguments of Channel settings names and values
         :return: True if successful, False if unsuccessful (Channel reloads in-place)
         :rtype: bool
         """
-        if self._dizque_instance.update_channel(channel_number=self.number, **kwargs):
-            self.refresh()
+        # channel data may have been modified in-place, cached objects are stale
+        self._clear_cache()
+        if self._deferred:
+            # hold the changes locally until batch_edit() pushes them
+            self._reload_locally(**kwargs)
+            self._dirty = True
+            return True
+        # this object already holds the full channel, so don't download it again just to merge in the changes
+        if self._dizque_instance._update_channel_data(
+                channel_number=self.number, current_data=dict(self._data), **kwargs
+        ):
+            if _refresh:
+                self.refresh()
+            else:
+                # dizqueTV now has exactly what was sent, no need to download it again
+                self._reload_locally(**kwargs)
             return True
         return False
 
+    @decorators.check_for_dizque_instance
+    @contextmanager
+    def batch_edit(self):
+        """
+        Group multiple edits to this Channel into a single update.
+
+        Edits made inside the block are applied locally and pushed to dizqueTV in one request when the block exits.
+        If an error is raised inside the block, the local edits are discarded.
+
+        :return: This Channel object
+        :rtype: Channel
+        """
+        self._deferred = True
+        self._dirty = False
+        try:
+            yield self
+        except Exception:
+            self._deferred = False
+            if self._dirty:
+                self._dirty = False
+                self.refresh()
+            raise
+        self._deferred = False
+        if self._dirty:
+            self._dirty = False
+            self.update(**self._data)
+
     @decorators.check_for_dizque_instance
     def edit(self, **kwargs) -> bool:
         """
@@ -583,26 +794,21 @@ class Channel(BaseAPIObject):
                 return self.add_programs(programs=[program], plex_server=plex_server)
             else:
                 kwargs = program._data
-        template = MOVIE_PROGRAM_TEMPLATE
-        if kwargs["type"] == "episode":
-            template = EPISODE_PROGRAM_TEMPLATE
-        elif kwargs["type"] == "track":
-            template = TRACK_PROGRAM_TEMPLATE
-        elif kwargs["type"] == "redirect":
-            template = REDIRECT_PROGRAM_TEMPLATE
+        template = _PROGRAM_TEMPLATES.get(kwargs["type"], MOVIE_PROGRAM_TEMPLATE)
         if helpers._settings_are_complete(
                 new_settings_dict=kwargs,
                 template_settings_dict=template,
                 ignore_keys=["_id", "id"],
         ):
-            channel_data = self._data
-            if not channel_data.get("duration"):
-                channel_data["duration"] = 0
-            if not channel_data.get("programs", []):
-                channel_data["programs"] = []
-            channel_data["programs"].append(kwargs)
-            channel_data["duration"] += kwargs.get("duration", 0)
-            return self.update(**channel_data)
+            return self.add_programs(
+                programs=[
+                    Program(
+                        data=kwargs,
+                        dizque_instance=self._dizque_instance,
+                        channel_instance=self,
+                    )
+                ]
+            )
         return False
 
     @decorators.check_for_dizque_instance
@@ -626,24 +832,36 @@ class Channel(BaseAPIObject):
             raise GeneralException(
                 "You must provide at least one program to add to the channel."
             )
+        if not channel_data.get("duration"):
+            channel_data["duration"] = 0
+        if not channel_data.get("programs", []):
+            channel_data["programs"] = []
 
         programs: List[Union[Program, Redirect, FillerItem, Video, Movie, Episode, Track]] = \
             self._dizque_instance.expand_custom_show_items(programs=programs)
 
+        plex_server = plex_server or self.plex_server
+        new_programs_data = []
         for program in programs:
-            if type(program) not in [Program, Redirect, FillerItem]:
-                # plex item needs to be converted to program
-                if not plex_server and not self.plex_server:
-                    raise MissingParametersError(
-                        "Please include a plex_server if you are adding PlexAPI Video, "
-                        "Movie, Episode or Track items."
-                    )
-                program = self._dizque_instance.convert_plex_item_to_program(
-                    plex_item=program,
-                    plex_server=(plex_server if plex_server else self.plex_server),
+            if type(program) in (Program, Redirect, FillerItem):
+                new_programs_data.append(program._data)
+                continue
+            # plex item needs to be converted to program data
+            if not plex_server:
+                raise MissingParametersError(
+                    "Please include a plex_server if you are adding PlexAPI Video, "
+                    "Movie, Episode or Track items."
                 )
-            channel_data["programs"].append(program._data)
-            channel_data["duration"] += program.duration
+            new_programs_data.append(
+                helpers._make_program_dict_from_plex_item(
+                    plex_item=program, plex_server=plex_server
+                )
+            )
+        channel_data["programs"].extend(new_programs_data)
+        channel_data["duration"] += sum(
+            program_data.get("duration") or 0 for program_data in new_programs_data
+        )
+        # all programs are pushed to dizqueTV in a single update
         return self.update(**channel_data)
 
     @decorators.check_for_dizque_instance
@@ -708,19 +926,18 @@ class Channel(BaseAPIObject):
         :rtype: bool
         """
         channel_data = self._data
-        for a_program in channel_data["programs"]:
-            if (program.type == "redirect" and a_program["type"] == "redirect") or (
-                    a_program["title"] == program.title
-            ):
-                if kwargs.get("duration"):
-                    channel_data["duration"] -= a_program["duration"]
-                    channel_data["duration"] += kwargs["duration"]
-                new_data = helpers._combine_settings(
-                    new_settings_dict=kwargs, default_dict=a_program
-                )
-                a_program.update(new_data)
-                return self.update(**channel_data)
-        return False
+        index = self._get_program_index(program=program)
+        if index is None:
+            return False
+        a_program = channel_data["programs"][index]
+        if kwargs.get("duration"):
+            channel_data["duration"] -= a_program["duration"]
+            channel_data["duration"] += kwargs["duration"]
+        new_data = helpers._combine_settings(
+            new_settings_dict=kwargs, default_dict=a_program
+        )
+        a_program.update(new_data)
+        return self.update(**channel_data)
 
     @decorators.check_for_dizque_instance
     def delete_program(self, program: Program) -> bool:
@@ -733,14 +950,12 @@ class Channel(BaseAPIObject):
         :rtype: bool
         """
         channel_data = self._data
-        for a_program in channel_data["programs"]:
-            if (program.type == "redirect" and a_program["type"] == "redirect") or (
-                    a_program["title"] == program.title
-            ):
-                channel_data["duration"] -= a_program["duration"]
-                channel_data["programs"].remove(a_program)
-                return self.update(**channel_data)
-        return False
+        index = self._get_program_index(program=program)
+        if index is None:
+            return False
+        channel_data["duration"] -= channel_data["programs"][index]["duration"]
+        del channel_data["programs"][index]
+        return self.update(**channel_data)
 
     @decorators.check_for_dizque_instance
     def delete_show(self, show_name: str, season_number: int = None) -> bool:
@@ -754,25 +969,19 @@ class Channel(BaseAPIObject):
         :return: True if successful, False if unsuccessful (Channel reloads in-place)
         :rtype: bool
         """
-        all_programs = self.programs
-        programs_to_add = []
-        for program in all_programs:
+        programs_to_keep = []
+        for program in self._program_data:
             # collect everything that's not an episode
-            if program.type != "episode":
-                programs_to_add.append(program)
-            else:
-                # collect everything that's not the targeted show
-                if program.showTitle != show_name:
-                    programs_to_add.append(program)
-                else:
-                    if season_number:
-                        # collect everything that's not the targeted season if there is one
-                        if season_number != season_number:
-                            programs_to_add.append(program)
-        if self.delete_all_programs():
-            # add back everything that's not the targeted show/season combo
-            return self.add_programs(programs=programs_to_add)
-        return False
+            if program.get("type") != "episode":
+                programs_to_keep.append(program)
+            # collect everything that's not the targeted show
+            elif program.get("showTitle") != show_name:
+                programs_to_keep.append(program)
+            # collect everything that's not the targeted season if there is one
+            elif season_number and program.get("season") != season_number:
+                programs_to_keep.append(program)
+        # keep everything that's not the targeted show/season combo
+        return self._replace_program_data(programs_data=programs_to_keep)
 
     @decorators.check_for_dizque_instance
     def add_x_number_of_show_episodes(
@@ -864,34 +1073,77 @@ class Channel(BaseAPIObject):
             list_index += 1
         return self.update(**channel_data)
 
-    @decorators.check_for_dizque_instance
-    def delete_all_programs(self) -> bool:
+    def _replace_programs(
+            self, programs: List[Union[Program, Redirect, FillerItem, CustomShow, dict]], **kwargs
+    ) -> bool:
         """
-        Delete all programs from this channel.
+        Replace all programs on this channel with a new list of programs, in a single update.
+
+        :param programs: List of Program, Redirect, FillerItem or CustomShow objects, or raw program data
+        :type programs: List[Union[Program, Redirect, FillerItem, CustomShow, dict]]
+        :param kwargs: keyword arguments of other Channel settings names and values to change in the same update
+        :return: True if successful, False if unsuccessful (Channel reloads in-place)
+        :rtype: bool
+        """
+        programs = self._dizque_instance.expand_custom_show_items(programs=programs)
+        return self._replace_program_data(
+            programs_data=[
+                program if isinstance(program, dict) else program._data
+                for program in programs
+            ],
+            **kwargs,
+        )
 
+    def _replace_program_data(self, programs_data: List[dict], **kwargs) -> bool:
+        """
+        Replace all programs on this channel with a new list of raw program data, in a single update.
+
+        :param programs_data: List of program JSON data
+        :type programs_data: List[dict]
+        :param kwargs: keyword arguments of other Channel settings names and values to change in the same update
         :return: True if successful, False if unsuccessful (Channel reloads in-place)
         :rtype: bool
         """
         channel_data = self._data
-        channel_data["duration"] -= sum(program.duration for program in self.programs)
-        channel_data["programs"] = []
+        if programs_data == self._program_data and all(
+                channel_data.get(key) == value for key, value in kwargs.items()
+        ):
+            # nothing would change, skip the round trip to dizqueTV
+            return True
+        channel_data.update(kwargs)
+        channel_data["programs"] = programs_data
+        channel_data["duration"] = sum(
+            program.get("duration") or 0 for program in programs_data
+        )
         return self.update(**channel_data)
 
+    def _get_programs_without_offline_times(self) -> List[Union[Program, CustomShow]]:
+        """
+        Get all programs on this channel, except for offline times (redirects are kept).
+
+        :return: List of Program and CustomShow objects
+        :rtype: List[Union[Program, CustomShow]]
+        """
+        return [
+            program
+            for program in self.programs
+            if not program.isOffline or program.type == "redirect"
+        ]
+
     @decorators.check_for_dizque_instance
-    def _delete_all_offline_times(self) -> bool:
+    def delete_all_programs(self) -> bool:
         """
-        Delete all offline program in a channel.
+        Delete all programs from this channel.
 
         :return: True if successful, False if unsuccessful (Channel reloads in-place)
         :rtype: bool
         """
-        programs_to_add = []
-        for program in self.programs:
-            if not program.isOffline or program.type == "redirect":
-                programs_to_add.append(program)
-        if programs_to_add and self.delete_all_programs():
-            return self.add_programs(programs=programs_to_add)
-        return False
+        channel_data = self._data
+        channel_data["duration"] -= sum(
+            program.get("duration", 0) for program in self._program_data
+        )
+        channel_data["programs"] = []
+        return self.update(**channel_data)
 
     @decorators.check_for_dizque_instance
     def add_filler_list(
@@ -958,9 +1210,9 @@ class Channel(BaseAPIObject):
         if filler_list:
             filler_list_id = filler_list.id
         channel_data = self._data
-        for a_list in channel_data["fillerCollections"]:
+        for index, a_list in enumerate(channel_data["fillerCollections"]):
             if filler_list_id == a_list.get("id"):
-                channel_data["fillerCollections"].remove(a_list)
+                del channel_data["fillerCollections"][index]
                 return self.update(**channel_data)
         return False
 
@@ -1058,12 +1310,48 @@ class Channel(BaseAPIObject):
         :return: True if successful, False if unsuccessful (Channel reloads in-place)
         :rtype: bool
         """
-        self._delete_all_offline_times()
-        if self.remove_duplicate_programs():  # also removes all redirects
-            self.sort_programs_randomly()
-        return self.update(scheduleBackup={})
+        # work out the final lineup locally, then push it and the schedule removal in one update
+        programs = self._get_programs_without_offline_times() or self.programs
+        unique_programs = helpers.remove_duplicate_media_items(
+            media_items=programs
+        )  # also removes all redirects
+        if unique_programs:
+            programs = helpers.sort_media_randomly(media_items=unique_programs)
+        return self._replace_programs(programs=programs, scheduleBackup={})
 
     # Sort Programs
+    def _has_custom_show_items(self) -> bool:
+        """
+        Check if any programs on this channel belong to a custom show.
+
+        :return: True if a custom show item is on the channel, False if not
+        :rtype: bool
+        """
+        return any(program.get("customShowId") for program in self._program_data)
+
+    def _sort_programs(self, sort_function, raw_sort_function=None, **kwargs) -> bool:
+        """
+        Sort all programs on this channel with a helpers.sort_media_* function, in a single update.
+
+        :param sort_function: Function that takes a list of media items and returns them sorted
+        :type sort_function: function
+        :param raw_sort_function: Function that takes a list of raw program data and returns it sorted, used when no custom shows need to be kept together
+        :type raw_sort_function: function, optional
+        :param kwargs: Extra keyword arguments to pass to the sort function
+        :return: True if successful, False if unsuccessful (Channel reloads in-place)
+        :rtype: bool
+        """
+        if raw_sort_function and not self._has_custom_show_items():
+            # no custom shows to keep together, so the raw program data can be sorted directly
+            sorted_programs = raw_sort_function(programs_data=self._program_data)
+            if sorted_programs:
+                return self._replace_program_data(programs_data=sorted_programs)
+            return False
+        sorted_programs = sort_function(media_items=self.programs, **kwargs)
+        if sorted_programs:
+            return self._replace_programs(programs=sorted_programs)
+        return False
+
     @decorators.check_for_dizque_instance
     def sort_programs_by_release_date(self) -> bool:
         """
@@ -1072,10 +1360,10 @@ class Channel(BaseAPIObject):
         :return: True if successful, False if unsuccessful (Channel reloads in-place)
         :rtype: bool
         """
-        sorted_programs = helpers.sort_media_by_release_date(media_items=self.programs)
-        if sorted_programs and self.delete_all_programs():
-            return self.add_programs(programs=sorted_programs)
-        return False
+        return self._sort_programs(
+            sort_function=helpers.sort_media_by_release_date,
+            raw_sort_function=helpers._sort_program_data_by_release_date,
+        )
 
     @decorators.check_for_dizque_instance
     def sort_programs_by_season_order(self) -> bool:
@@ -1087,10 +1375,7 @@ class Channel(BaseAPIObject):
         :return: True if successful, False if unsuccessful (Channel reloads in-place)
         :rtype: bool
         """
-        sorted_programs = helpers.sort_media_by_season_order(media_items=self.programs)
-        if sorted_programs and self.delete_all_programs():
-            return self.add_programs(programs=sorted_programs)
-        return False
+        return self._sort_programs(sort_function=helpers.sort_media_by_season_order)
 
     @decorators.check_for_dizque_instance
     def sort_programs_alphabetically(self) -> bool:
@@ -1100,10 +1385,10 @@ class Channel(BaseAPIObject):
         :return: True if successful, False if unsuccessful (Channel reloads in-place)
         :rtype: bool
         """
-        sorted_programs = helpers.sort_media_alphabetically(media_items=self.programs)
-        if sorted_programs and self.delete_all_programs():
-            return self.add_programs(programs=sorted_programs)
-        return False
+        return self._sort_programs(
+            sort_function=helpers.sort_media_alphabetically,
+            raw_sort_function=helpers._sort_program_data_alphabetically,
+        )
 
     @decorators.check_for_dizque_instance
     def sort_programs_by_duration(self) -> bool:
@@ -1113,10 +1398,10 @@ class Channel(BaseAPIObject):
         :return: True if successful, False if unsuccessful (Channel reloads in-place)
         :rtype: bool
         """
-        sorted_programs = helpers.sort_media_by_duration(media_items=self.programs)
-        if sorted_programs and self.delete_all_programs():
-            return self.add_programs(programs=sorted_programs)
-        return False
+        return self._sort_programs(
+            sort_function=helpers.sort_media_by_duration,
+            raw_sort_function=helpers._sort_program_data_by_duration,
+        )
 
     @decorators.check_for_dizque_instance
     def sort_programs_randomly(self) -> bool:
@@ -1126,10 +1411,10 @@ class Channel(BaseAPIObject):
         :return: True if successful, False if unsuccessful (Channel reloads in-place)
         :rtype: bool
         """
-        sorted_programs = helpers.sort_media_randomly(media_items=self.programs)
-        if sorted_programs and self.delete_all_programs():
-            return self.add_programs(programs=sorted_programs)
-        return False
+        return self._sort_programs(
+            sort_function=helpers.sort_media_randomly,
+            raw_sort_function=helpers._shuffle_program_data,
+        )
 
     @decorators.check_for_dizque_instance
     def cyclical_shuffle(self) -> bool:
@@ -1139,10 +1424,7 @@ class Channel(BaseAPIObject):
         :return: True if successful, False if unsuccessful (Channel reloads in-place)
         :rtype: bool
         """
-        sorted_programs = helpers.sort_media_cyclical_shuffle(media_items=self.programs)
-        if sorted_programs and self.delete_all_programs():
-            return self.add_programs(programs=sorted_programs)
-        return False
+        return self._sort_programs(sort_function=helpers.sort_media_cyclical_shuffle)
 
     @decorators.check_for_dizque_instance
     def block_shuffle(self, block_length: int, randomize: bool = False) -> bool:
@@ -1156,12 +1438,11 @@ class Channel(BaseAPIObject):
         :return: True if successful, False if unsuccessful (Channel reloads in-place)
         :rtype: bool
         """
-        sorted_programs = helpers.sort_media_block_shuffle(
-            media_items=self.programs, block_length=block_length, randomize=randomize
+        return self._sort_programs(
+            sort_function=helpers.sort_media_block_shuffle,
+            block_length=block_length,
+            randomize=randomize,
         )
-        if sorted_programs and self.delete_all_programs():
-            return self.add_programs(programs=sorted_programs)
-        return False
 
     @decorators.check_for_dizque_instance
     def replicate(self, how_many_times: int) -> bool:
@@ -1176,13 +1457,13 @@ class Channel(BaseAPIObject):
         :return: True if successful, False if unsuccessful (Channel reloads in-place)
         :rtype: bool
         """
-        programs = self.programs
-        final_program_list = []
-        for _ in range(0, how_many_times):
-            for program in programs:
-                final_program_list.append(program)
-        if final_program_list and self.delete_all_programs():
-            return self.add_programs(programs=final_program_list)
+        programs = self._dizque_instance.expand_custom_show_items(programs=self.programs)
+        # each repeat gets its own copy, so editing one program later doesn't edit all of them
+        final_program_list = [
+            dict(program._data) for _ in range(how_many_times) for program in programs
+        ]
+        if final_program_list:
+            return self._replace_program_data(programs_data=final_program_list)
         return False
 
     @decorators.check_for_dizque_instance
@@ -1201,12 +1482,16 @@ class Channel(BaseAPIObject):
         programs = self.programs
         final_program_list = []
         for _ in range(0, how_many_times):
-            list_to_shuffle = programs
+            list_to_shuffle = programs[:]
             helpers.shuffle(list_to_shuffle)
-            for program in list_to_shuffle:
-                final_program_list.append(program)
-        if final_program_list and self.delete_all_programs():
-            return self.add_programs(programs=final_program_list)
+            final_program_list.extend(list_to_shuffle)
+        final_program_list = self._dizque_instance.expand_custom_show_items(
+            programs=final_program_list
+        )
+        if final_program_list:
+            return self._replace_program_data(
+                programs_data=[dict(program._data) for program in final_program_list]
+            )
         return False
 
     @decorators.check_for_dizque_instance
@@ -1219,12 +1504,10 @@ class Channel(BaseAPIObject):
         :return: True if successful, False if unsuccessful (Channel reloads in-place)
         :rtype: bool
         """
-        sorted_programs = helpers.remove_duplicate_media_items(
-            media_items=self.programs
+        return self._sort_programs(
+            sort_function=helpers.remove_duplicate_media_items,
+            raw_sort_function=helpers._remove_duplicate_program_data,
         )
-        if sorted_programs and self.delete_all_programs():
-            return self.add_programs(programs=sorted_programs)
-        return False
 
     @decorators.check_for_dizque_instance
     def remove_duplicate_redirects(self) -> bool:
@@ -1234,11 +1517,18 @@ class Channel(BaseAPIObject):
         :return: True if successful, False if unsuccessful (Channel reloads in-place)
         :rtype: bool
         """
-        sorted_programs = helpers.remove_duplicates_by_attribute(
-            items=self.programs, attribute_name="channel"
+        if self._has_custom_show_items():
+            sorted_programs = helpers.remove_duplicates_by_attribute(
+                items=self.programs, attribute_name="channel"
+            )
+            if sorted_programs:
+                return self._replace_programs(programs=sorted_programs)
+            return False
+        sorted_programs = helpers._remove_duplicates_by_key(
+            items=self._program_data, key="channel"
         )
-        if sorted_programs and self.delete_all_programs():
-            return self.add_programs(programs=sorted_programs)
+        if sorted_programs:
+            return self._replace_program_data(programs_data=sorted_programs)
         return False
 
     @decorators.check_for_dizque_instance
@@ -1249,15 +1539,13 @@ class Channel(BaseAPIObject):
         :return: True if successful, False if unsuccessful (Channel reloads in-place)
         :rtype: bool
         """
-        non_redirects = []
-        for item in self.programs:
-            if (
-                    not helpers._object_has_attribute(obj=item, attribute_name="type")
-                    or item.type != "redirect"
-            ):
-                non_redirects.append(item)
-        if non_redirects and self.delete_all_programs():
-            return self.add_programs(programs=non_redirects)
+        non_redirects = [
+            program
+            for program in self._program_data
+            if program.get("type") != "redirect"
+        ]
+        if non_redirects:
+            return self._replace_program_data(programs_data=non_redirects)
         return False
 
     @decorators.check_for_dizque_instance
@@ -1270,24 +1558,14 @@ class Channel(BaseAPIObject):
         :return: True if successful, False if unsuccessful (Channel reloads in-place)
         :rtype: bool
         """
-        non_redirects = [
-            item
-            for item in self.programs
-            if (
-                    helpers._object_has_attribute(obj=item, attribute_name="type")
-                    and item.type != "redirect"
-            )
-        ]
         non_specials = [
-            item
-            for item in non_redirects
-            if (
-                    helpers._object_has_attribute(obj=item, attribute_name="season")
-                    and item.season != 0
-            )
+            program
+            for program in self._program_data
+            if program.get("type") not in (None, "redirect")
+            and program.get("season") not in (None, 0)
         ]
-        if non_specials and self.delete_all_programs():
-            return self.add_programs(programs=non_specials)
+        if non_specials:
+            return self._replace_program_data(programs_data=non_specials)
         return False
 
     @decorators.check_for_dizque_instance
@@ -1301,23 +1579,34 @@ class Channel(BaseAPIObject):
         :rtype: bool
         """
         programs_and_pads = []
-        if self._delete_all_offline_times():
-            for program in self.programs:
-                filler_time_needed = helpers.get_needed_flex_time(
-                    item_time_milliseconds=program.duration,
-                    allowed_minutes_time_frame=start_every_x_minutes,
+        if self._has_custom_show_items():
+            programs = self._get_programs_without_offline_times()
+            durations = [program.duration for program in programs]
+        else:
+            # no custom shows to keep together, so pad the raw program data directly
+            programs = [
+                program
+                for program in self._program_data
+                if not program.get("isOffline") or program.get("type") == "redirect"
+            ]
+            durations = [program.get("duration") for program in programs]
+        if programs:
+            # the interval only depends on the current time, so work it out once for every program
+            time_frame = helpers._get_flex_time_frame(
+                allowed_minutes_time_frame=start_every_x_minutes
+            )
+            for program, duration in zip(programs, durations):
+                filler_time_needed = helpers._get_needed_flex_time_in_frame(
+                    item_time_milliseconds=duration,
+                    allowed_milliseconds_time_frame=time_frame,
                 )
                 programs_and_pads.append(program)
                 if filler_time_needed > 0:
                     programs_and_pads.append(
-                        Program(
-                            data={"duration": filler_time_needed, "isOffline": True},
-                            dizque_instance=self._dizque_instance,
-                            channel_instance=self,
-                        )
+                        {"duration": filler_time_needed, "isOffline": True}
                     )
-            if programs_and_pads and self.delete_all_programs():
-                return self.add_programs(programs=programs_and_pads)
+            if programs_and_pads:
+                return self._replace_programs(programs=programs_and_pads)
         return False
 
     @decorators.check_for_dizque_instance
@@ -1338,27 +1627,28 @@ class Channel(BaseAPIObject):
         """
         if start_time > datetime.utcnow():
             raise GeneralException("You cannot use a start time in the future.")
-        start_time = start_time.strftime("%Y-%m-%dT%H:%M:%S.000Z")
-        self.remove_duplicate_programs()
+        start_time = helpers.datetime_to_string(datetime_object=start_time)
+        programs = helpers.remove_duplicate_media_items(media_items=self.programs)
         programs_to_add, running_time = helpers._get_first_x_minutes_of_programs(
-            programs=self.programs, minutes=length_hours * 60
+            programs=programs, minutes=length_hours * 60
         )
         if running_time < (length_hours * 60 * 60 * 1000):
             time_needed = (length_hours * 60 * 60 * 1000) - running_time
             programs_to_add.append(
-                Program(
-                    data={"duration": time_needed, "isOffline": True},
-                    dizque_instance=self._dizque_instance,
-                    channel_instance=self,
-                )
+                {"duration": time_needed, "isOffline": True}
+            )
+        programs_data = [
+            program if isinstance(program, dict) else program._data
+            for program in programs_to_add
+        ]
+        # each repeat gets its own copy, so editing one rerun later doesn't edit all of them
+        final_programs_to_add = [
+            dict(program) for _ in range(times_to_repeat) for program in programs_data
+        ]
+        if final_programs_to_add:
+            return self._replace_programs(
+                programs=final_programs_to_add, startTime=start_time
             )
-        final_programs_to_add = []
-        for _ in range(0, times_to_repeat):
-            for program in programs_to_add:
-                final_programs_to_add.append(program)
-        self.update(startTime=start_time)
-        if final_programs_to_add and self.delete_all_programs():
-            return self.add_programs(programs=final_programs_to_add)
         return False
 
     @decorators.check_for_dizque_instance
@@ -1383,61 +1673,41 @@ class Channel(BaseAPIObject):
             raise GeneralException("end_hour must be between 0 and 23.")
         if start_hour == end_hour:
             raise GeneralException("You cannot add a 24-hour Channel at Night.")
-        if night_channel_number not in self._dizque_instance.channel_numbers:
+        # work from one local snapshot of the programs, the channel is only touched by the final update
+        all_programs = self.programs
+        if not all_programs:
+            # nothing to interlace with the night channel
+            return False
+        if not self._dizque_instance.channel_exists(channel_number=night_channel_number):
             raise GeneralException(f"Channel #{night_channel_number} does not exist.")
         length_of_night_block = helpers.get_milliseconds_between_two_hours(
             start_hour=start_hour, end_hour=end_hour
         )
         length_of_regular_block = (24 * 60 * 60 * 1000) - length_of_night_block
-        new_channel_start_time = datetime.now().replace(
+        now = datetime.now()
+        new_channel_start_time = now.replace(
             hour=end_hour, minute=0, second=0, microsecond=0
         )
-        if end_hour > datetime.now().hour:
+        if end_hour > now.hour:
             new_channel_start_time = new_channel_start_time - timedelta(days=1)
         new_channel_start_time = new_channel_start_time + timedelta(
             hours=helpers.hours_difference_in_timezone()
         )
-        new_channel_start_time = new_channel_start_time.strftime(
-            "%Y-%m-%dT%H:%M:%S.000Z"
+        new_channel_start_time = helpers.datetime_to_string(
+            datetime_object=new_channel_start_time
         )
-        final_programs_to_add = []
-        programs_left = self.programs
-        while programs_left:  # loop until you get done with all the programs
-            (
-                programs_to_add,
-                total_running_time,
-                programs_left,
-            ) = helpers._get_first_x_minutes_of_programs_return_unused(
-                programs=programs_left, minutes=int(length_of_regular_block / 1000 / 60)
-            )
-            if total_running_time < length_of_regular_block:
-                # add flex time between last item and night channel
-                time_needed = length_of_regular_block - total_running_time
-                programs_to_add.append(
-                    Program(
-                        data={"duration": time_needed, "isOffline": True},
-                        dizque_instance=self._dizque_instance,
-                        channel_instance=self,
-                    )
-                )
-            programs_to_add.append(
-                Redirect(
-                    data={
-                        "duration": length_of_night_block,
-                        "isOffline": True,
-                        "channel": night_channel_number,
-                        "type": "redirect",
-                    },
-                    dizque_instance=self._dizque_instance,
-                    channel_instance=self,
-                )
+        final_programs_to_add = helpers._make_night_channel_lineup(
+            blocks=helpers._split_programs_into_blocks(
+                programs=all_programs, minutes=length_of_regular_block // 60000
+            ),
+            block_length=length_of_regular_block,
+            night_channel_number=night_channel_number,
+            night_block_length=length_of_night_block,
+        )
+        if final_programs_to_add:
+            return self._replace_programs(
+                programs=final_programs_to_add, startTime=new_channel_start_time
             )
-            for program in programs_to_add:
-                final_programs_to_add.append(program)
-
-        self.update(startTime=new_channel_start_time)
-        if final_programs_to_add and self.delete_all_programs():
-            return self.add_programs(programs=final_programs_to_add)
         return False
 
     @decorators.check_for_dizque_instance
@@ -1460,7 +1730,11 @@ class Channel(BaseAPIObject):
             raise GeneralException("start_hour must be between 0 and 23.")
         if end_hour > 23 or end_hour < 0:
             raise GeneralException("end_hour must be between 0 and 23.")
-        if night_channel_number not in self._dizque_instance.channel_numbers:
+        all_programs = self.programs
+        if not all_programs:
+            # nothing to interlace with the night channel
+            return False
+        if not self._dizque_instance.channel_exists(channel_number=night_channel_number):
             raise GeneralException(f"Channel #{night_channel_number} does not exist.")
         length_of_night_block = helpers.get_milliseconds_between_two_hours(
             start_hour=start_hour, end_hour=end_hour
@@ -1479,109 +1753,30 @@ class Channel(BaseAPIObject):
                 hour=start_hour, minute=0, second=0, microsecond=0
             ),
         )
-        final_programs_to_add = []
-        all_programs = self.programs
-        programs_to_add, total_running_time = helpers._get_first_x_minutes_of_programs(
-            programs=all_programs, minutes=int(time_until_night_block_start / 1000 / 60)
+        # one pass over the running times for the first block and all the regular ones
+        blocks = helpers._split_programs_into_blocks(
+            programs=all_programs,
+            minutes=length_of_regular_block // 60000,
+            first_block_minutes=time_until_night_block_start // 60000,
         )
-        if len(programs_to_add) == len(
-                all_programs
-        ):  # all programs can play before night channel even starts
-            if (
-                    total_running_time < time_until_night_block_start
-            ):  # add flex time between last item and night channel
-                time_needed = time_until_night_block_start - total_running_time
-                programs_to_add.append(
-                    Program(
-                        data={"duration": time_needed, "isOffline": True},
-                        dizque_instance=self._dizque_instance,
-                        channel_instance=self,
-                    )
-                )
-            # add the night channel
-            programs_to_add.append(
-                Redirect(
-                    data={
-                        "duration": length_of_night_block,
-                        "isOffline": True,
-                        "channel": night_channel_number,
-                        "type": "redirect",
-                    },
-                    dizque_instance=self._dizque_instance,
-                    channel_instance=self,
-                )
-            )
-            final_programs_to_add = programs_to_add
-        else:  # need to interlace programs and night channels
-            programs_left = all_programs
-            (
-                programs_to_add,
-                total_running_time,
-                programs_left,
-            ) = helpers._get_first_x_minutes_of_programs_return_unused(
-                programs=programs_left,
-                minutes=int(time_until_night_block_start / 1000 / 60),
-            )
-            if (
-                    total_running_time < time_until_night_block_start
-            ):  # add flex time between last item and night channel
-                time_needed = time_until_night_block_start - total_running_time
-                programs_to_add.append(
-                    Program(
-                        data={"duration": time_needed, "isOffline": True},
-                        dizque_instance=self._dizque_instance,
-                        channel_instance=self,
-                    )
-                )
-            # add the night channel
-            programs_to_add.append(
-                Redirect(
-                    data={
-                        "duration": length_of_night_block,
-                        "isOffline": True,
-                        "channel": night_channel_number,
-                        "type": "redirect",
-                    },
-                    dizque_instance=self._dizque_instance,
-                    channel_instance=self,
-                )
+        # first block runs up to the first night channel
+        final_programs_to_add = helpers._make_night_channel_lineup(
+            blocks=blocks[:1],
+            block_length=time_until_night_block_start,
+            night_channel_number=night_channel_number,
+            night_block_length=length_of_night_block,
+        )
+        # the rest are interlaced with night channels in regular-length blocks
+        final_programs_to_add.extend(
+            helpers._make_night_channel_lineup(
+                blocks=blocks[1:],
+                block_length=length_of_regular_block,
+                night_channel_number=night_channel_number,
+                night_block_length=length_of_night_block,
             )
-            final_programs_to_add = programs_to_add
-            while programs_left:  # loop until you get done with all the programs
-                (
-                    programs_to_add,
-                    total_running_time,
-                    programs_left,
-                ) = helpers._get_first_x_minutes_of_programs_return_unused(
-                    programs=programs_left,
-                    minutes=int(length_of_regular_block / 1000 / 60),
-                )
-                if total_running_time < length_of_regular_block:
-                    # add flex time between last item and night channel
-                    time_needed = length_of_regular_block - total_running_time
-                    programs_to_add.append(
-                        Program(
-                            data={"duration": time_needed, "isOffline": True},
-                            dizque_instance=self._dizque_instance,
-                            channel_instance=self,
-                        )
-                    )
-                programs_to_add.append(
-                    Redirect(
-                        data={
-                            "duration": length_of_night_block,
-                            "isOffline": True,
-                            "channel": night_channel_number,
-                            "type": "redirect",
-                        },
-                        dizque_instance=self._dizque_instance,
-                        channel_instance=self,
-                    )
-                )
-                for program in programs_to_add:
-                    final_programs_to_add.append(program)
-        if final_programs_to_add and self.delete_all_programs():
-            return self.add_programs(programs=final_programs_to_add)
+        )
+        if final_programs_to_add:
+            return self._replace_programs(programs=final_programs_to_add)
         return False
 
     @decorators.check_for_dizque_instance
@@ -1597,8 +1792,8 @@ class Channel(BaseAPIObject):
         sorted_programs = helpers.balance_shows(
             media_items=self.programs, margin_of_correction=margin_of_error
         )
-        if sorted_programs and self.delete_all_programs():
-            return self.add_programs(programs=sorted_programs)
+        if sorted_programs:
+            return self._replace_programs(programs=sorted_programs)
         return False
 
     @decorators.check_for_dizque_instance
@@ -276,11 +276,11 @@ class CustomShow(BaseAPIObject):
         :rtype: bool
         """
         custom_show_data = self._data
-        for a_program in custom_show_data["content"]:
+        for index, a_program in enumerate(custom_show_data["content"]):
             if a_program["title"] == program.title:
                 if custom_show_data.get("duration"):
                     custom_show_data["duration"] -= a_program["duration"]
-                custom_show_data["content"].remove(a_program)
+                del custom_show_data["content"][index]
                 return self.update(**custom_show_data)
         return False
 
@@ -295,11 +295,27 @@ class CustomShow(BaseAPIObject):
         custom_show_data = self._data
         if custom_show_data.get("duration"):
             custom_show_data["duration"] -= sum(
-                program.duration for program in self.content
+                program.get("duration") or 0 for program in custom_show_data["content"]
             )
         custom_show_data["content"] = []
         return self.update(**custom_show_data)
 
+    def _replace_content(self, items: List[CustomShowItem]) -> bool:
+        """
+        Replace all custom show items on this custom show with a new list of items, in a single update.
+
+        :param items: List of CustomShowItem objects
+        :type items: List[CustomShowItem]
+        :return: True if successful, False if unsuccessful (CustomShow reloads in-place)
+        :rtype: bool
+        """
+        custom_show_data = self._data
+        custom_show_data["content"] = [item._full_data for item in items]
+        custom_show_data["count"] = len(items)
+        if custom_show_data.get("duration") is not None:
+            custom_show_data["duration"] = sum(item.duration or 0 for item in items)
+        return self.update(**custom_show_data)
+
     # Sort FillerItem
     @decorators.check_for_dizque_instance
     def sort_filler_by_duration(self) -> bool:
@@ -310,8 +326,8 @@ class CustomShow(BaseAPIObject):
         :rtype: bool
         """
         sorted_programs = helpers.sort_media_by_duration(media_items=self.content)
-        if sorted_programs and self.delete_all_programs():
-            return self.add_programs(programs=sorted_programs)
+        if sorted_programs:
+            return self._replace_content(items=sorted_programs)
         return False
 
     @decorators.check_for_dizque_instance
@@ -323,8 +339,8 @@ class CustomShow(BaseAPIObject):
         :rtype: bool
         """
         sorted_programs = helpers.sort_media_randomly(media_items=self.content)
-        if sorted_programs and self.delete_all_programs():
-            return self.add_programs(programs=sorted_programs)
+        if sorted_programs:
+            return self._replace_content(items=sorted_programs)
         return False
 
     @decorators.check_for_dizque_instance
@@ -336,8 +352,8 @@ class CustomShow(BaseAPIObject):
         :rtype: bool
         """
         sorted_programs = helpers.remove_duplicate_media_items(media_items=self.content)
-        if sorted_programs and self.delete_all_programs():
-            return self.add_programs(programs=sorted_programs)
+        if sorted_programs:
+            return self._replace_content(items=sorted_programs)
         return False
 
     # Delete
@@ -37,7 +37,6 @@ class FillerList(BaseAPIObject):
         """
         temp_filler_list = self._dizque_instance.get_filler_list(filler_list_id=self.id)
         if temp_filler_list:
-            print(temp_filler_list)
             json_data = temp_filler_list._data
             self.__init__(data=json_data, dizque_instance=self._dizque_instance)
             del temp_filler_list
@@ -108,9 +107,19 @@ class FillerList(BaseAPIObject):
         :return: FillerItem object or None
         :rtype: FillerItem
         """
-        for filler_item in self.content:
-            if filler_item_title == filler_item_title:
-                return filler_item
+        if not self._filler_data:
+            self.refresh()
+        # only wrap the match, rather than every item on the list
+        for filler_data in self._filler_data:
+            if (
+                not filler_data.get("customShowId")
+                and filler_data.get("title") == filler_item_title
+            ):
+                return FillerItem(
+                    data=filler_data,
+                    dizque_instance=self._dizque_instance,
+                    filler_list_instance=self,
+                )
         return None
 
     @decorators.check_for_dizque_instance
@@ -153,11 +162,15 @@ class FillerList(BaseAPIObject):
             template_settings_dict=FILLER_ITEM_TEMPLATE,
             ignore_keys=["_id", "id"],
         ):
-            filler_list_data = self._data
-            filler_list_data["content"].append(kwargs)
-            if filler_list_data.get("duration"):
-                filler_list_data["duration"] += kwargs["duration"]
-            return self.update(**filler_list_data)
+            return self.add_fillers(
+                fillers=[
+                    FillerItem(
+                        data=kwargs,
+                        dizque_instance=self._dizque_instance,
+                        filler_list_instance=self,
+                    )
+                ]
+            )
         return False
 
     @decorators.check_for_dizque_instance
@@ -169,6 +182,8 @@ class FillerList(BaseAPIObject):
         """
         Add multiple programs to this channel.
 
+        Note: Items whose ratingKey is already on this filler list are skipped.
+
         :param fillers: List of FillerItem, CustomShow, plexapi.video.Video, plexapi.video.Movie, plexapi.video.Episode or plexapi.audio.Track objects
         :type fillers: List[Union[FillerItem, CustomShow, plexapi.video.Video, plexapi.video.Movie, plexapi.video.Episode, plexapi.audio.Track]]
         :param plex_server: plexapi.server.PlexServer object (required if adding PlexAPI Video, Movie, Episode or Track objects)
@@ -176,14 +191,17 @@ class FillerList(BaseAPIObject):
         :return: True if successful, False if unsuccessful (Channel reloads in place)
         :rtype: bool
         """
-        filler_list_data = self._data
-
         fillers = self._dizque_instance.expand_custom_show_items(
             programs=fillers
         )
 
+        existing_keys = {
+            filler.get("ratingKey") for filler in self._data.get("content") or []
+        }
+        existing_keys.discard(None)
+        resolved_fillers = []
         for filler in fillers:
-            if type(filler) not in [FillerItem, CustomShowItem]:
+            if not isinstance(filler, (FillerItem, CustomShowItem)):
                 if not plex_server:
                     raise MissingParametersError(
                         "Please include a plex_server if you are adding PlexAPI Video, "
@@ -192,9 +210,22 @@ class FillerList(BaseAPIObject):
                 filler = self._dizque_instance.convert_plex_item_to_filler(
                     plex_item=filler, plex_server=plex_server
                 )
-            filler_list_data["content"].append(filler._data)
-            if filler_list_data.get("duration"):
-                filler_list_data["duration"] += filler.duration
+            rating_key = filler._data.get("ratingKey")
+            if rating_key is not None:
+                if rating_key in existing_keys:
+                    continue
+                existing_keys.add(rating_key)
+            resolved_fillers.append(filler._data)
+        if not resolved_fillers:
+            # everything is already on this filler list, nothing to push
+            return True
+        filler_list_data = self._data
+        filler_list_data["content"].extend(resolved_fillers)
+        if filler_list_data.get("duration"):
+            filler_list_data["duration"] += sum(
+                filler.get("duration") or 0 for filler in resolved_fillers
+            )
+        # all filler items are pushed to dizqueTV in a single update
         return self.update(**filler_list_data)
 
     @decorators.check_for_dizque_instance
@@ -208,16 +239,19 @@ class FillerList(BaseAPIObject):
         :return: True if successful, False if unsuccessful (FillerList reloads in-place)
         :rtype: bool
         """
-        filler_list_data = self._data
-        for a_filler in filler_list_data["content"]:
+        filler_list_data = dict(self._data)
+        for index, a_filler in enumerate(filler_list_data["content"]):
             if a_filler["title"] == filler.title:
                 if kwargs.get("duration"):
                     filler_list_data["duration"] -= a_filler["duration"]
                     filler_list_data["duration"] += kwargs["duration"]
+                # _combine_settings fills in default_dict in place, so give it a copy
                 new_data = helpers._combine_settings(
-                    new_settings_dict=kwargs, default_dict=a_filler
+                    new_settings_dict=kwargs, default_dict=dict(a_filler)
                 )
-                a_filler.update(new_data)
+                content_data = list(filler_list_data["content"])
+                content_data[index] = new_data
+                filler_list_data["content"] = content_data
                 return self.update(**filler_list_data)
         return False
 
@@ -232,11 +266,11 @@ class FillerList(BaseAPIObject):
         :rtype: bool
         """
         filler_list_data = self._data
-        for a_filler in filler_list_data["content"]:
+        for index, a_filler in enumerate(filler_list_data["content"]):
             if a_filler["title"] == filler.title:
                 if filler_list_data.get("duration"):
                     filler_list_data["duration"] -= a_filler["duration"]
-                filler_list_data["content"].remove(a_filler)
+                del filler_list_data["content"][index]
                 return self.update(**filler_list_data)
         return False
 
@@ -251,11 +285,76 @@ class FillerList(BaseAPIObject):
         filler_list_data = self._data
         if filler_list_data.get("duration"):
             filler_list_data["duration"] -= sum(
-                filler.duration for filler in self.content
+                filler.get("duration") or 0 for filler in filler_list_data["content"]
             )
         filler_list_data["content"] = []
         return self.update(**filler_list_data)
 
+    def _has_custom_show_items(self) -> bool:
+        """
+        Check if any filler items on this filler list belong to a custom show.
+
+        :return: True if a custom show item is on the filler list, False if not
+        :rtype: bool
+        """
+        return any(
+            filler.get("customShowId") for filler in self._data.get("content") or []
+        )
+
+    def _replace_content_data(self, content_data: List[dict]) -> bool:
+        """
+        Replace all filler items on this filler list with new raw filler data, in a single update.
+
+        :param content_data: List of filler item JSON data
+        :type content_data: List[dict]
+        :return: True if successful, False if unsuccessful (FillerList reloads in-place)
+        :rtype: bool
+        """
+        filler_list_data = self._data
+        filler_list_data["content"] = content_data
+        if filler_list_data.get("duration") is not None:
+            filler_list_data["duration"] = sum(
+                filler.get("duration") or 0 for filler in content_data
+            )
+        return self.update(**filler_list_data)
+
+    def _replace_content(self, items: List[Union[FillerItem, CustomShow]]) -> bool:
+        """
+        Replace all filler items on this filler list with a new list of items, in a single update.
+
+        :param items: List of FillerItem and CustomShow objects
+        :type items: List[Union[FillerItem, CustomShow]]
+        :return: True if successful, False if unsuccessful (FillerList reloads in-place)
+        :rtype: bool
+        """
+        # custom shows are stored as their individual items, not as a single entry
+        items = self._dizque_instance.expand_custom_show_items(programs=items)
+        return self._replace_content_data(content_data=[item._data for item in items])
+
+    def _sort_content(self, sort_function, raw_sort_function) -> bool:
+        """
+        Sort all filler items on this filler list, in a single update.
+
+        :param sort_function: Function that takes a list of media items and returns them sorted
+        :type sort_function: function
+        :param raw_sort_function: Function that takes a list of raw filler data and returns it sorted, used when no custom shows need to be kept together
+        :type raw_sort_function: function
+        :return: True if successful, False if unsuccessful (FillerList reloads in-place)
+        :rtype: bool
+        """
+        if not self._has_custom_show_items():
+            # no custom shows to keep together, so the raw filler data can be sorted directly
+            sorted_filler = raw_sort_function(
+                programs_data=self._data.get("content") or []
+            )
+            if sorted_filler:
+                return self._replace_content_data(content_data=sorted_filler)
+            return False
+        sorted_filler = sort_function(media_items=self.content)
+        if sorted_filler:
+            return self._replace_content(items=sorted_filler)
+        return False
+
     # Sort FillerItem
     @decorators.check_for_dizque_instance
     def sort_filler_by_duration(self) -> bool:
@@ -265,10 +364,10 @@ class FillerList(BaseAPIObject):
         :return: True if successful, False if unsuccessful (FillerList reloads in-place)
         :rtype: bool
         """
-        sorted_filler = helpers.sort_media_by_duration(media_items=self.content)
-        if sorted_filler and self.delete_all_fillers():
-            return self.add_fillers(fillers=sorted_filler)
-        return False
+        return self._sort_content(
+            sort_function=helpers.sort_media_by_duration,
+            raw_sort_function=helpers._sort_program_data_by_duration,
+        )
 
     @decorators.check_for_dizque_instance
     def sort_filler_randomly(self) -> bool:
@@ -278,10 +377,10 @@ class FillerList(BaseAPIObject):
         :return: True if successful, False if unsuccessful (FillerList reloads in-place)
         :rtype: bool
         """
-        sorted_filler = helpers.sort_media_randomly(media_items=self.content)
-        if sorted_filler and self.delete_all_fillers():
-            return self.add_fillers(fillers=sorted_filler)
-        return False
+        return self._sort_content(
+            sort_function=helpers.sort_media_randomly,
+            raw_sort_function=helpers._shuffle_program_data,
+        )
 
     @decorators.check_for_dizque_instance
     def remove_duplicate_fillers(self) -> bool:
@@ -291,10 +390,10 @@ class FillerList(BaseAPIObject):
         :return: True if successful, False if unsuccessful (FillerList reloads in-place)
         :rtype: bool
         """
-        sorted_filler = helpers.remove_duplicate_media_items(media_items=self.content)
-        if sorted_filler and self.delete_all_fillers():
-            return self.add_fillers(fillers=sorted_filler)
-        return False
+        return self._sort_content(
+            sort_function=helpers.remove_duplicate_media_items,
+            raw_sort_function=helpers._remove_duplicate_program_data,
+        )
 
     # Delete
     @decorators.check_for_dizque_instance
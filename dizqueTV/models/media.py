@@ -2,6 +2,25 @@ import dizqueTV.decorators as decorators
 from dizqueTV.exceptions import MissingParametersError
 from dizqueTV.models.base import BaseAPIObject
 
+_MEDIA_ITEM_KEYS = (
+    "title",
+    "key",
+    "ratingKey",
+    "icon",
+    "summary",
+    "date",
+    "year",
+    "plexFile",
+    "file",
+    "showTitle",
+    "episode",
+    "season",
+    "serverKey",
+    "showIcon",
+    "episodeIcon",
+    "seasonIcon",
+)
+
 
 class BaseMediaItem(BaseAPIObject):
     def __init__(self, data: dict, dizque_instance, channel_instance=None):
@@ -21,24 +40,7 @@ class MediaItem(BaseMediaItem):
             dizque_instance=dizque_instance,
             channel_instance=channel_instance,
         )
-        self.title = data.get("title")
-        self.key = data.get("key")
-        self.ratingKey = data.get("ratingKey")
-        self.duration = data.get("duration")
-        self.icon = data.get("icon")
-        self.summary = data.get("summary")
-        self.date = data.get("date")
-        self.year = data.get("year")
-        self.plexFile = data.get("plexFile")
-        self.file = data.get("file")
-        self.showTitle = data.get("showTitle")
-        self.episode = data.get("episode")
-        self.season = data.get("season")
-        self.serverKey = data.get("serverKey")
-
-        self.showIcon = data.get("showIcon")
-        self.episodeIcon = data.get("episodeIcon")
-        self.seasonIcon = data.get("seasonIcon")
+        self.__dict__.update((key, data.get(key)) for key in _MEDIA_ITEM_KEYS)
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.title})"
@@ -99,7 +101,7 @@ class Program(MediaItem, Redirect):
                 raise Exception("Could not find program.")
             else:
                 data = temp_program._data
-                self._channel_instance = (temp_program._channel_instance,)
+                self._channel_instance = temp_program._channel_instance
                 self._dizque_instance = temp_program._dizque_instance
                 del temp_program
         self.__init__(
@@ -158,7 +160,7 @@ class FillerItem(MediaItem):
                 raise Exception("Could not find filler item.")
             else:
                 data = temp_item._data
-                self._filler_list_instance = (temp_item._filler_list_instance,)
+                self._filler_list_instance = temp_item._filler_list_instance
                 self._dizque_instance = temp_item._dizque_instance
                 del temp_item
         self.__init__(
@@ -175,7 +177,7 @@ class FillerItem(MediaItem):
         :return: True if successful, False if unsuccessful
         :rtype: bool
         """
-        return self._filler_list_instance.update_filler(program=self, **kwargs)
+        return self._filler_list_instance.update_filler(filler=self, **kwargs)
 
     @decorators.check_for_dizque_instance
     def delete(self) -> bool:
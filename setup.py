@@ -101,6 +101,7 @@ setuptools.setup(
     install_requires=REQUIREMENTS,
     extras_require={
         "dev": DEV_REQUIREMENTS,
+        "fast": ["orjson"],
     },
     test_suite="test",
     classifiers=classifiers,
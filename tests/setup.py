@@ -1,9 +1,12 @@
+import copy
 import os
 
 import plexapi
 from dotenv import load_dotenv
 
 import dizqueTV
+from dizqueTV.models.channels import Channel
+from dizqueTV.models.fillers import FillerList
 
 fake_plex_server = {
     "name": "Test",
@@ -50,3 +53,74 @@ def plex_server() -> "plexapi.server.PlexServer":
 def plex_server_as_dizquetv_server() -> dizqueTV.PlexServer:
     utils = _make_plex_utils()
     return utils.as_dizquetv_plex_server
+
+
+class FakeDizqueTV:
+    """
+    Stand-in for dizqueTV.API that keeps channels and filler lists in memory.
+
+    Records every update instead of sending it, so model methods can be tested without a server.
+    """
+
+    def __init__(self, channels: list = None, filler_lists: list = None):
+        self._channels = {data["number"]: data for data in channels or []}
+        self._filler_lists = {data["id"]: data for data in filler_lists or []}
+        self.channel_updates = []
+        self.filler_list_updates = []
+
+    def get_channel(self, channel_number: int) -> Channel:
+        data = self._channels.get(channel_number)
+        if data:
+            return Channel(data=copy.deepcopy(data), dizque_instance=self)
+        return None
+
+    def _update_channel_data(
+        self, channel_number: int, current_data: dict, **kwargs
+    ) -> bool:
+        new_data = copy.deepcopy(current_data)
+        new_data.update(copy.deepcopy(kwargs))
+        self.channel_updates.append(new_data)
+        self._channels[channel_number] = new_data
+        return True
+
+    def get_filler_list(self, filler_list_id: str) -> FillerList:
+        data = self._filler_lists.get(filler_list_id)
+        if data:
+            return FillerList(data=copy.deepcopy(data), dizque_instance=self)
+        return None
+
+    def update_filler_list(self, filler_list_id: str, **kwargs) -> bool:
+        new_data = copy.deepcopy(self._filler_lists[filler_list_id])
+        new_data.update(copy.deepcopy(kwargs))
+        self.filler_list_updates.append(new_data)
+        self._filler_lists[filler_list_id] = new_data
+        return True
+
+    def expand_custom_show_items(self, programs: list) -> list:
+        return programs
+
+
+def fake_channel_data(programs: list = None, filler_lists: list = None) -> dict:
+    return {
+        "number": 1,
+        "name": "Channel 1",
+        "duration": sum(program.get("duration") or 0 for program in programs or []),
+        "programs": programs or [],
+        "fillerCollections": filler_lists or [],
+    }
+
+
+def fake_program(title: str, **kwargs) -> dict:
+    program = {"title": title, "type": "movie", "duration": 60000, "isOffline": False}
+    program.update(kwargs)
+    return program
+
+
+def fake_episode(show_title: str, season: int, episode: int) -> dict:
+    return fake_program(
+        title=f"{show_title} s{season}e{episode}",
+        type="episode",
+        showTitle=show_title,
+        season=season,
+        episode=episode,
+    )
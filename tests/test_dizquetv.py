@@ -3,8 +3,15 @@ from time import sleep
 import pytest
 
 import dizqueTV
-from tests.setup import (client,
+from dizqueTV import decorators
+from dizqueTV.exceptions import NotRemoteObjectError
+from dizqueTV.models.fillers import FillerList
+from tests.setup import (FakeDizqueTV,
+                         client,
+                         fake_channel_data,
+                         fake_episode,
                          fake_plex_server,
+                         fake_program,
                          plex_server,
                          _plex_vars_exist,
                          plex_server_as_dizquetv_server)
@@ -70,6 +77,13 @@ class TestGeneral:
         channels = client().channels
         assert type(channels) == list
 
+    def test_channel_exists(self):
+        numbers = client().channel_numbers
+        for number in numbers:
+            assert client().channel_exists(channel_number=number) is True
+        missing_number = max(numbers, default=0) + 1
+        assert client().channel_exists(channel_number=missing_number) is False
+
     def test_channel_programs_property(self):
         channels = client().channels
         for channel in channels:
@@ -83,6 +97,161 @@ class TestGeneral:
             assert type(programs) == list
 
 
+class TestChannelModel:
+    def test_program_exists(self):
+        dizque = FakeDizqueTV(
+            channels=[fake_channel_data(programs=[fake_program(title="Movie A")])]
+        )
+        channel = dizque.get_channel(channel_number=1)
+        assert channel.program_exists(program_title="Movie A") is True
+        assert channel.program_exists(program_title="Movie B") is False
+
+    def test_filler_list_exists(self):
+        dizque = FakeDizqueTV(
+            channels=[
+                fake_channel_data(
+                    programs=[fake_program(title="Movie A")],
+                    filler_lists=[{"id": "filler-a", "weight": 300, "cooldown": 0}],
+                )
+            ]
+        )
+        channel = dizque.get_channel(channel_number=1)
+        assert channel.filler_list_exists(filler_list_id="filler-a") is True
+        assert channel.filler_list_exists(filler_list_id="filler-b") is False
+
+    def test_batch_edit_sends_one_update(self):
+        dizque = FakeDizqueTV(
+            channels=[fake_channel_data(programs=[fake_program(title="Movie A")])]
+        )
+        channel = dizque.get_channel(channel_number=1)
+        with channel.batch_edit():
+            channel.update(name="New name")
+            channel.update(stealth=True)
+            channel.update(fillerRepeatCooldown=30000)
+        assert len(dizque.channel_updates) == 1
+        sent = dizque.channel_updates[0]
+        assert sent["name"] == "New name"
+        assert sent["stealth"] is True
+        assert sent["fillerRepeatCooldown"] == 30000
+        assert channel.name == "New name"
+
+    def test_batch_edit_error_sends_nothing(self):
+        dizque = FakeDizqueTV(
+            channels=[fake_channel_data(programs=[fake_program(title="Movie A")])]
+        )
+        channel = dizque.get_channel(channel_number=1)
+        with pytest.raises(ValueError):
+            with channel.batch_edit():
+                channel.update(name="New name")
+                raise ValueError("abort")
+        assert dizque.channel_updates == []
+        # local edits are thrown away, channel is reloaded from dizqueTV
+        assert channel.name == "Channel 1"
+        assert channel._deferred is False
+        channel.update(name="After")
+        assert len(dizque.channel_updates) == 1
+
+    def test_remove_specials(self):
+        programs = [
+            fake_episode(show_title="Show A", season=0, episode=1),
+            fake_episode(show_title="Show A", season=1, episode=1),
+            {"type": "redirect", "channel": 2, "duration": 60000, "isOffline": True},
+            fake_episode(show_title="Show B", season=0, episode=2),
+            fake_episode(show_title="Show B", season=2, episode=1),
+        ]
+        dizque = FakeDizqueTV(channels=[fake_channel_data(programs=programs)])
+        channel = dizque.get_channel(channel_number=1)
+        assert channel.remove_specials() is True
+        sent = dizque.channel_updates[-1]
+        assert [program["title"] for program in sent["programs"]] == [
+            "Show A s1e1",
+            "Show B s2e1",
+        ]
+        assert sent["duration"] == 2 * 60000
+
+    def test_delete_show(self):
+        programs = [
+            fake_episode(show_title="Show A", season=1, episode=1),
+            fake_episode(show_title="Show A", season=1, episode=2),
+            fake_episode(show_title="Show A", season=2, episode=1),
+            fake_episode(show_title="Show B", season=1, episode=1),
+            fake_program(title="Movie A"),
+        ]
+        dizque = FakeDizqueTV(channels=[fake_channel_data(programs=programs)])
+        channel = dizque.get_channel(channel_number=1)
+        assert channel.delete_show(show_name="Show A") is True
+        assert [program["title"] for program in channel._program_data] == [
+            "Show B s1e1",
+            "Movie A",
+        ]
+
+    def test_delete_show_season(self):
+        programs = [
+            fake_episode(show_title="Show A", season=1, episode=1),
+            fake_episode(show_title="Show A", season=1, episode=2),
+            fake_episode(show_title="Show A", season=2, episode=1),
+            fake_episode(show_title="Show B", season=1, episode=1),
+            fake_program(title="Movie A"),
+        ]
+        dizque = FakeDizqueTV(channels=[fake_channel_data(programs=programs)])
+        channel = dizque.get_channel(channel_number=1)
+        assert channel.delete_show(show_name="Show A", season_number=1) is True
+        assert [program["title"] for program in channel._program_data] == [
+            "Show A s2e1",
+            "Show B s1e1",
+            "Movie A",
+        ]
+        assert dizque.channel_updates[-1]["duration"] == 3 * 60000
+
+
+class TestFillerModel:
+    def test_filler_item_update_and_refresh(self):
+        dizque = FakeDizqueTV(
+            filler_lists=[
+                {
+                    "id": "filler-a",
+                    "name": "Filler A",
+                    "content": [fake_program(title="Bumper", duration=10000)],
+                    "duration": 10000,
+                }
+            ]
+        )
+        filler_list = dizque.get_filler_list(filler_list_id="filler-a")
+        filler = filler_list.get_filler_item(filler_item_title="Bumper")
+        # FillerItem.update hands itself to FillerList.update_filler as filler=
+        assert filler.update(duration=20000) is True
+        assert dizque.filler_list_updates[-1]["content"][0]["duration"] == 20000
+        filler.refresh(filler_item_title="Bumper")
+        # the parent filler list must stay a FillerList, not get wrapped in a tuple
+        assert isinstance(filler._filler_list_instance, FillerList)
+        assert filler._filler_list_instance is filler_list
+        assert filler.duration == 20000
+        # and the refreshed item can still be updated through its parent
+        assert filler.update(duration=30000) is True
+        assert dizque.filler_list_updates[-1]["content"][0]["duration"] == 30000
+
+
+class _DecoratedObject:
+    def __init__(self, dizque_instance):
+        self._dizque_instance = dizque_instance
+
+    @decorators.check_for_dizque_instance
+    def combine(self, first, second, third=None):
+        return first, second, third
+
+
+class TestDecorators:
+    def test_check_for_dizque_instance_passes_positional_args(self):
+        obj = _DecoratedObject(dizque_instance=FakeDizqueTV())
+        assert obj.combine(1, 2) == (1, 2, None)
+        assert obj.combine(1, 2, third=3) == (1, 2, 3)
+
+    def test_check_for_dizque_instance_missing(self):
+        obj = _DecoratedObject(dizque_instance=None)
+        with pytest.raises(NotRemoteObjectError):
+            obj.combine(1, 2)
+
+
 class TestWithFakePlex:
     def test_add_plex_server(self):
         # add a fake Plex server